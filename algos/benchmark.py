@@ -0,0 +1,249 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+from bubble_sort import bubble_sort
+from external_sort import external_sort
+from hybrid_sort import hybrid_sort
+from insertion_sort import insertion_sort
+from merge_sort import bottom_up_merge_sort, merge_sort
+from parallel_merge_sort import parallel_merge_sort
+from radix_sort import counting_sort, radix_sort
+
+
+def _external_sort(data):
+    """Sort a list through external_sort, with small chunks."""
+    data[:] = external_sort(data, max_items=max(16, len(data) // 8))
+
+
+# Sorts to benchmark, each taking a list of integers to sort in place.
+SORTS = {
+    "bubble": bubble_sort,
+    "insertion": insertion_sort,
+    "merge": lambda data: merge_sort(data, 0, len(data) - 1),
+    "bottom_up_merge": lambda data: bottom_up_merge_sort(data, 0,
+                                                         len(data) - 1),
+    "hybrid": hybrid_sort,
+    "parallel_merge": parallel_merge_sort,
+    "external": _external_sort,
+    "counting": counting_sort,
+    "radix": radix_sort,
+}
+
+# Sorts taking quadratic time, which are skipped above QUADRATIC_LIMIT
+# elements unless asked for by name.
+QUADRATIC = {"bubble", "insertion"}
+QUADRATIC_LIMIT = 4096
+
+# Sorts that compare elements in other processes, where the counts can't
+# be gathered.
+UNCOUNTED = {"parallel_merge"}
+
+# Sorts that move elements through files, where only the comparisons are
+# counted.
+UNCOUNTED_MOVES = {"external"}
+
+# Number of distinct values of the few-unique distribution.
+FEW_UNIQUE = 8
+
+# Share of elements swapped out of place in the nearly-sorted distribution.
+NEARLY_SORTED_SWAPS = 0.01
+
+
+def _random(size, rng):
+    return [rng.randrange(size) for _ in range(size)]
+
+
+def _sorted(size, rng):
+    return list(range(size))
+
+
+def _reversed(size, rng):
+    return list(range(size, 0, -1))
+
+
+def _few_unique(size, rng):
+    return [rng.randrange(FEW_UNIQUE) for _ in range(size)]
+
+
+def _nearly_sorted(size, rng):
+    data = list(range(size))
+    for _ in range(max(1, int(size * NEARLY_SORTED_SWAPS)) if size else 0):
+        i, j = rng.randrange(size), rng.randrange(size)
+        data[i], data[j] = data[j], data[i]
+    return data
+
+
+# Input distributions, each making a list of integers of a given size.
+DISTRIBUTIONS = {
+    "random": _random,
+    "sorted": _sorted,
+    "reversed": _reversed,
+    "few_unique": _few_unique,
+    "nearly_sorted": _nearly_sorted,
+}
+
+
+class CountedInt(int):
+    """An integer that counts how often it is compared.
+
+    The count of all instances is kept in CountedInt.comparisons. Only
+    instrumented runs use these, so plain runs pay nothing for counting.
+    """
+
+    comparisons = 0
+    __hash__ = int.__hash__
+
+    def __lt__(self, other):
+        CountedInt.comparisons += 1
+        return int.__lt__(self, other)
+
+    def __le__(self, other):
+        CountedInt.comparisons += 1
+        return int.__le__(self, other)
+
+    def __gt__(self, other):
+        CountedInt.comparisons += 1
+        return int.__gt__(self, other)
+
+    def __ge__(self, other):
+        CountedInt.comparisons += 1
+        return int.__ge__(self, other)
+
+    def __eq__(self, other):
+        CountedInt.comparisons += 1
+        return int.__eq__(self, other)
+
+    def __ne__(self, other):
+        CountedInt.comparisons += 1
+        return int.__ne__(self, other)
+
+
+class CountedList(list):
+    """A list that counts the elements written to it.
+
+    The count of all instances is kept in CountedList.moves. Slices are
+    CountedLists as well, so writes to the buffers a sort copies runs into
+    are counted like those to the list itself. Taking a slice counts
+    nothing, so a copy such as data[:] = scratch[:n] counts every element
+    once, where it is written.
+    """
+
+    moves = 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return CountedList(super().__getitem__(index))
+        return super().__getitem__(index)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            CountedList.moves += len(value)
+        else:
+            CountedList.moves += 1
+        super().__setitem__(index, value)
+
+
+def measure(sort, data, repeat=1):
+    """Return the best wall time of sort over repeat copies of data.
+
+    Also returns whether the last copy came out sorted.
+    """
+    best = None
+    for _ in range(repeat):
+        copy = list(data)
+        start = time.perf_counter()
+        sort(copy)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, copy == sorted(data)
+
+
+def count(sort, data):
+    """Return the comparisons and moves sort makes on data."""
+    copy = CountedList(map(CountedInt, data))
+    CountedInt.comparisons = 0
+    CountedList.moves = 0
+    sort(copy)
+    return CountedInt.comparisons, CountedList.moves
+
+
+def run(sizes, distributions, sorts=None, repeat=1, instrument=False,
+        seed=0):
+    """Benchmark every sort on every size and distribution.
+
+    sorts are names of SORTS, all of them by default, in which case the
+    quadratic ones are skipped above QUADRATIC_LIMIT elements. Returns a
+    list of result dicts; comparisons and moves are only included if
+    instrument is set, and are taken from a separate untimed run; they
+    are None where they can't be counted.
+    """
+    skip_quadratic = sorts is None
+    if sorts is None:
+        sorts = list(SORTS)
+    results = []
+    for distribution in distributions:
+        for size in sizes:
+            data = DISTRIBUTIONS[distribution](size, random.Random(seed))
+            for name in sorts:
+                if (skip_quadratic and name in QUADRATIC
+                        and size > QUADRATIC_LIMIT):
+                    continue
+                seconds, ok = measure(SORTS[name], data, repeat)
+                result = {
+                    "sort": name,
+                    "distribution": distribution,
+                    "size": size,
+                    "seconds": seconds,
+                    "sorted": ok,
+                }
+                if instrument:
+                    comparisons = moves = None
+                    if name not in UNCOUNTED:
+                        comparisons, moves = count(SORTS[name], data)
+                    if name in UNCOUNTED_MOVES:
+                        moves = None
+                    result["comparisons"] = comparisons
+                    result["moves"] = moves
+                results.append(result)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark the sorts of algos and print JSON results."
+    )
+    parser.add_argument("--sorts", nargs="+", choices=SORTS,
+                        help="sorts to run, all by default")
+    parser.add_argument("--sizes", nargs="+", type=int,
+                        default=[100, 1000, 10000])
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS,
+                        default=list(DISTRIBUTIONS))
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per case, the best time is reported")
+    parser.add_argument("--count", action="store_true",
+                        help="also count comparisons and moves")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="file to write, stdout by default")
+    args = parser.parse_args(argv)
+    report = {
+        "python": platform.python_version(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "results": run(args.sizes, args.distributions, args.sorts,
+                       args.repeat, args.count, args.seed),
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,16 @@
-def bubble_sort(data):
-    """An implementation of the bubble sort algorithm."""
+from decorate import decorate_sort
+
+
+def bubble_sort(data, key=None, reverse=False):
+    """An implementation of the bubble sort algorithm.
+
+    Elements are compared by key(element) if key is given, and sorted in
+    descending order if reverse is set. Either way the key is computed once
+    per element and the sort is stable.
+    """
+    if key is not None or reverse:
+        decorate_sort(data, 0, len(data), key, reverse, bubble_sort)
+        return
     for pass_ in range(len(data) - 1):
         for cur in range(len(data) - pass_ -1):
             if data[cur] > data[cur + 1]:
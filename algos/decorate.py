@@ -0,0 +1,25 @@
+def decorate_sort(data, lo, hi, key, reverse, sort, keys=None):
+    """Sorts data[lo:hi] by key with a decorate-sort-undecorate pass.
+
+    Every element is replaced by a pair of its key, computed exactly once,
+    and its position, then sort(pairs) sorts the list of pairs in
+    ascending order and the elements are put back in the order of the
+    pairs. As positions are unique, the sort never compares the elements
+    themselves and equal keys keep their original order.
+
+    If reverse is set the positions are negated and the sorted pairs are
+    read backwards, which orders the keys descending while still keeping
+    equal keys in their original order. key None sorts by the elements.
+    keys, if given, are the keys of data[lo:hi] computed already, and key
+    is then not called.
+    """
+    items = list(data[lo:hi])
+    if keys is None:
+        keys = items if key is None else map(key, items)
+    sign = -1 if reverse else 1
+    pairs = [(k, sign * i) for i, k in enumerate(keys)]
+    sort(pairs)
+    if reverse:
+        pairs.reverse()
+    for position, (_, i) in enumerate(pairs, lo):
+        data[position] = items[sign * i]
@@ -0,0 +1,137 @@
+from contextlib import ExitStack
+from heapq import merge
+from itertools import count, islice
+from operator import itemgetter
+import os
+import pickle
+import sys
+import tempfile
+
+from merge_sort import merge_sort
+
+
+# Default number of records sorted in memory at a time.
+MAX_ITEMS = 100000
+
+# Default number of run files merged at once.
+FAN_IN = 64
+
+# Number of records pickled together in a run file.
+BATCH_SIZE = 1024
+
+
+def external_sort(records, max_items=None, max_bytes=None, temp_dir=None,
+                  fan_in=None, key=None, reverse=False):
+    """Implements an external merge sort for data that doesn't fit in memory.
+
+    records, any iterable such as an open file, is read as a stream in
+    chunks of at most max_items records or max_bytes bytes, as measured by
+    sys.getsizeof. Every chunk is sorted by merge_sort and spilled to a run
+    file of pickled batches in a temporary directory under temp_dir. The
+    runs are merged fan_in at a time, in several passes if there are more,
+    and the last merge is a generator yielding the records in order. The
+    arguments are checked when it is called, before any record is read.
+
+    Records are compared by key(record) if key is given, and yielded in
+    descending order if reverse is set. The key is computed once per record
+    and stored next to it in the run files. Stable. The run files are
+    deleted once the generator is exhausted or closed.
+    """
+    if max_items is None and max_bytes is None:
+        max_items = MAX_ITEMS
+    if max_items is not None and max_items < 1:
+        raise ValueError("max_items must be a positive integer.")
+    if max_bytes is not None and max_bytes < 1:
+        raise ValueError("max_bytes must be a positive integer.")
+    fan_in = FAN_IN if fan_in is None else fan_in
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2.")
+    return _external_sort(records, max_items, max_bytes, temp_dir, fan_in,
+                          key, reverse)
+
+
+def _external_sort(records, max_items, max_bytes, temp_dir, fan_in, key,
+                   reverse):
+    """Yield the sorted records; the arguments are checked by external_sort."""
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        names = (os.path.join(directory, f"{i}.run") for i in count())
+        pair_key = None if key is None else itemgetter(0)
+        runs = []
+        for chunk in _chunks(records, max_items, max_bytes):
+            if key is not None:
+                chunk = [(key(record), record) for record in chunk]
+            merge_sort(chunk, 0, len(chunk) - 1, pair_key, reverse)
+            runs.append(next(names))
+            _write_run(runs[-1], chunk)
+        while len(runs) > fan_in:
+            merged = []
+            for start in range(0, len(runs), fan_in):
+                merged.append(next(names))
+                _merge_runs(runs[start:start + fan_in], merged[-1],
+                            pair_key, reverse)
+            runs = merged
+        with ExitStack() as stack:
+            files = [stack.enter_context(open(run, "rb")) for run in runs]
+            result = merge(*map(_read_run, files), key=pair_key,
+                           reverse=reverse)
+            if key is None:
+                yield from result
+            else:
+                for _, record in result:
+                    yield record
+
+
+def _chunks(records, max_items, max_bytes):
+    """Yield lists of consecutive records within the memory limits."""
+    chunk = []
+    size = 0
+    for record in records:
+        chunk.append(record)
+        if max_bytes is not None:
+            size += sys.getsizeof(record)
+        if ((max_items is not None and len(chunk) >= max_items)
+                or (max_bytes is not None and size >= max_bytes)):
+            yield chunk
+            chunk = []
+            size = 0
+    if chunk:
+        yield chunk
+
+
+def _write_run(path, records):
+    """Write records to a run file at path in pickled batches."""
+    records = iter(records)
+    with open(path, "wb") as file:
+        while True:
+            batch = list(islice(records, BATCH_SIZE))
+            if not batch:
+                break
+            pickle.dump(batch, file, pickle.HIGHEST_PROTOCOL)
+
+
+def _read_run(file):
+    """Yield the records of an open run file."""
+    while True:
+        try:
+            batch = pickle.load(file)
+        except EOFError:
+            return
+        yield from batch
+
+
+def _merge_runs(paths, target, key, reverse):
+    """Merge the run files at paths into one at target and delete them."""
+    with ExitStack() as stack:
+        files = [stack.enter_context(open(path, "rb")) for path in paths]
+        _write_run(target, merge(*map(_read_run, files), key=key,
+                                 reverse=reverse))
+    for path in paths:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    import random
+
+    data = [random.randrange(1000) for _ in range(10000)]
+    result = list(external_sort(data, max_items=500, fan_in=4))
+    print(result == sorted(data))
@@ -0,0 +1,172 @@
+from bisect import bisect_left, bisect_right
+
+from decorate import decorate_sort
+from insertion_sort import insertion_sort
+
+
+# Number of consecutive wins of one run after which merging switches to
+# galloping, i.e. to copying whole stretches found by exponential search.
+MIN_GALLOP = 7
+
+
+def hybrid_sort(data, key=None, reverse=False):
+    """A run-adaptive hybrid of the insertion sort and merge sort algorithms.
+
+    The list is split into natural runs: ascending ones are kept and
+    strictly descending ones reversed in place. Runs shorter than a minimum
+    length are extended with insertion sort and the runs are then merged
+    pairwise with galloping. Sorts in place and is stable; already sorted
+    or reversed input takes linear time, the worst case is O(n log n).
+
+    Elements are compared by key(element) if key is given, and sorted in
+    descending order if reverse is set; the key is computed once per
+    element.
+    """
+    if key is not None or reverse:
+        decorate_sort(data, 0, len(data), key, reverse, hybrid_sort)
+        return
+    size = len(data)
+    min_run = _min_run(size)
+    runs = []
+    lo = 0
+    while lo < size:
+        hi = _find_run(data, lo, size)
+        if hi - lo < min_run:
+            hi = min(lo + min_run, size)
+            insertion_sort(data, lo, hi)
+        runs.append((lo, hi - lo))
+        _collapse(data, runs)
+        lo = hi
+    while len(runs) > 1:
+        _merge_at(data, runs, len(runs) - 2)
+
+
+def _min_run(size):
+    """Return the minimum run length for a list of the given size.
+
+    The length is between 32 and 64 and chosen so that size / min_run is
+    a power of two or slightly less, which keeps the final merges balanced.
+    """
+    extra = 0
+    while size >= 64:
+        extra |= size & 1
+        size >>= 1
+    return size + extra
+
+
+def _find_run(data, lo, hi):
+    """Return the end of the natural run starting at lo.
+
+    A strictly descending run is reversed in place, so the run is always
+    ascending. Only strict descent is reversed to keep the sort stable.
+    """
+    end = lo + 1
+    if end == hi:
+        return end
+    if data[end] < data[lo]:
+        while end < hi and data[end] < data[end - 1]:
+            end += 1
+        data[lo:end] = data[lo:end][::-1]
+    else:
+        while end < hi and not data[end] < data[end - 1]:
+            end += 1
+    return end
+
+
+def _collapse(data, runs):
+    """Merge runs on the stack until the run lengths decrease fast enough.
+
+    Every run must be longer than the sum of the next two, and longer
+    than the next one, so the stack stays logarithmic in size.
+    """
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if ((n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1])
+                or (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1])):
+            if runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+        elif runs[n][1] > runs[n + 1][1]:
+            break
+        _merge_at(data, runs, n)
+
+
+def _merge_at(data, runs, i):
+    """Merge the i-th run on the stack with the next one."""
+    lo, first = runs[i]
+    second = runs[i + 1][1]
+    _merge(data, lo, lo + first, lo + first + second)
+    runs[i:i + 2] = [(lo, first + second)]
+
+
+def _gallop_right(key, seq, lo, hi):
+    """Return bisect_right(seq, key, lo, hi), probing near lo first."""
+    limit = lo
+    step = 1
+    while limit < hi and not key < seq[limit]:
+        lo = limit + 1
+        limit += step
+        step *= 2
+    return bisect_right(seq, key, lo, min(limit, hi))
+
+
+def _gallop_left(key, seq, lo, hi):
+    """Return bisect_left(seq, key, lo, hi), probing near lo first."""
+    limit = lo
+    step = 1
+    while limit < hi and seq[limit] < key:
+        lo = limit + 1
+        limit += step
+        step *= 2
+    return bisect_left(seq, key, lo, min(limit, hi))
+
+
+def _merge(data, lo, mid, hi):
+    """Merge the adjacent sorted stretches data[lo:mid] and data[mid:hi].
+
+    Elements of either stretch that are already in their final place are
+    skipped first, and only what remains of the left one is copied out.
+    """
+    lo = _gallop_right(data[mid], data, lo, mid)
+    if lo == mid:
+        return
+    hi = _gallop_left(data[mid - 1], data, mid, hi)
+    left = data[lo:mid]
+    i, j, k = 0, mid, lo
+    while i < len(left) and j < hi:
+        left_wins = right_wins = 0
+        while i < len(left) and j < hi:
+            if data[j] < left[i]:
+                data[k] = data[j]
+                j += 1
+                right_wins += 1
+                left_wins = 0
+            else:
+                data[k] = left[i]
+                i += 1
+                left_wins += 1
+                right_wins = 0
+            k += 1
+            if left_wins >= MIN_GALLOP or right_wins >= MIN_GALLOP:
+                break
+        while i < len(left) and j < hi:
+            end = _gallop_right(data[j], left, i, len(left))
+            from_left = end - i
+            data[k:k + from_left] = left[i:end]
+            k += from_left
+            i = end
+            if i == len(left):
+                break
+            end = _gallop_left(left[i], data, j, hi)
+            from_right = end - j
+            data[k:k + from_right] = data[j:end]
+            k += from_right
+            j = end
+            if from_left < MIN_GALLOP and from_right < MIN_GALLOP:
+                break
+    data[k:k + len(left) - i] = left[i:]
+
+
+if __name__ == "__main__":
+    data = [1, 2, 3, 9, 8, 7, 4, 5, 6, 0, 10, 11]
+    hybrid_sort(data)
+    print(data)
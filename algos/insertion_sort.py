@@ -1,9 +1,23 @@
-def insertion_sort(array):
-    """An implementation of the insertion sort algorithm."""
-    for k in range(1, len(array)):
+from decorate import decorate_sort
+
+
+def insertion_sort(array, lo=0, hi=None, key=None, reverse=False):
+    """An implementation of the insertion sort algorithm.
+
+    Sorts array[lo:hi] in place, the whole array by default. Elements are
+    compared by key(element) if key is given, and sorted in descending
+    order if reverse is set. Either way the key is computed once per
+    element and the sort is stable.
+    """
+    if hi is None:
+        hi = len(array)
+    if key is not None or reverse:
+        decorate_sort(array, lo, hi, key, reverse, insertion_sort)
+        return
+    for k in range(lo + 1, hi):
         cur = array[k]
         j = k
-        while j > 0 and array[j-1] > cur:
+        while j > lo and array[j-1] > cur:
             array[j] = array[j-1]
             j -= 1
         array[j] = cur
@@ -1,7 +1,18 @@
 
-def merge_sort(A, p, r):
-    """Implements the merge sort algorithm."""
-    
+from decorate import decorate_sort
+
+
+def merge_sort(A, p, r, key=None, reverse=False):
+    """Implements the merge sort algorithm.
+
+    Sorts A[p..r] in place. Elements are compared by key(element) if key
+    is given, and sorted in descending order if reverse is set. Either way
+    the key is computed once per element and the sort is stable.
+    """
+    if key is not None or reverse:
+        decorate_sort(A, p, r + 1, key, reverse,
+                      lambda pairs: merge_sort(pairs, 0, len(pairs) - 1))
+        return
     if p == r:
         return 
     elif p < r:
@@ -31,6 +42,74 @@ def merge_sort(A, p, r):
             leftover = first_part[first_part_index:]
 
         A[insert_index: r+1] = leftover
+
+
+def bottom_up_merge_sort(A, p, r, key=None, reverse=False):
+    """Implements the merge sort algorithm iteratively, bottom-up.
+
+    Sorts A[p..r] in place like merge_sort, but instead of recursing it
+    merges runs of width 1, 2, 4, ... back and forth between A and a single
+    buffer of r - p + 1 elements allocated up front, so no merge allocates.
+    key and reverse work as for merge_sort.
+    """
+    if key is not None or reverse:
+        decorate_sort(A, p, r + 1, key, reverse,
+                      lambda pairs: bottom_up_merge_sort(pairs, 0,
+                                                         len(pairs) - 1))
+        return
+    size = r - p + 1
+    if size < 2:
+        return
+    buffer = A[p:r+1]
+    source, source_offset = A, p
+    target, target_offset = buffer, 0
+    width = 1
+    while width < size:
+        for lo in range(0, size, 2 * width):
+            _merge_runs(source, source_offset, target, target_offset,
+                        lo, min(lo + width, size), min(lo + 2 * width, size))
+        source, target = target, source
+        source_offset, target_offset = target_offset, source_offset
+        width *= 2
+    if source is buffer:
+        A[p:r+1] = buffer
+
+
+def _merge_runs(source, source_offset, target, target_offset, lo, mid, hi):
+    """Merge the sorted runs [lo, mid) and [mid, hi) of source into target.
+
+    Positions are relative to the offsets of the two sequences.
+    """
+    i = lo + source_offset
+    j = mid + source_offset
+    first_end = mid + source_offset
+    second_end = hi + source_offset
+    k = lo + target_offset
+    if i < first_end and j < second_end:
+        first, second = source[i], source[j]
+        while True:
+            if first <= second:
+                target[k] = first
+                k += 1
+                i += 1
+                if i == first_end:
+                    break
+                first = source[i]
+            else:
+                target[k] = second
+                k += 1
+                j += 1
+                if j == second_end:
+                    break
+                second = source[j]
+    while i < first_end:
+        target[k] = source[i]
+        i += 1
+        k += 1
+    while j < second_end:
+        target[k] = source[j]
+        j += 1
+        k += 1
             
 
         
@@ -40,3 +119,7 @@ if __name__ == "__main__":
     A = [1, 4, 23, 2, 3, 21, 17, 15, 25]
     A = [1, 5, 3, 2, 4]
     merge_sort(A, 0, len(A)-1)
+    print(A)
+    A = [1, 4, 23, 2, 3, 21, 17, 15, 25]
+    bottom_up_merge_sort(A, 0, len(A)-1)
+    print(A)
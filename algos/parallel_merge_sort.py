@@ -0,0 +1,110 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from heapq import merge
+from multiprocessing import shared_memory
+import os
+
+from decorate import decorate_sort
+from merge_sort import merge_sort
+
+
+# Smallest number of elements worth sending to a worker process.
+MIN_CHUNK = 4096
+
+# Array typecodes that a memoryview can be cast to, i.e. that can be
+# shared with the workers without pickling.
+SHAREABLE_TYPECODES = "bBhHiIlLqQfd"
+
+
+def parallel_merge_sort(data, workers=None, key=None, reverse=False):
+    """Implements the merge sort algorithm on a pool of worker processes.
+
+    data, a list or an array, is split into one chunk per worker, the
+    chunks are sorted by merge_sort in the workers and the sorted chunks
+    are combined by a heap-based k-way merge. Numeric arrays are handed to
+    the workers through shared memory instead of being pickled. Sorts in
+    place and is stable.
+
+    Elements are compared by key(element) if key is given, and sorted in
+    descending order if reverse is set. The keys are computed once per
+    element in this process, so key needn't be picklable.
+    """
+    if key is not None or reverse:
+        decorate_sort(data, 0, len(data), key, reverse,
+                      lambda pairs: parallel_merge_sort(pairs, workers))
+        return
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be a positive integer.")
+    chunks = min(workers, -(-len(data) // MIN_CHUNK))
+    if chunks < 2:
+        merge_sort(data, 0, len(data) - 1)
+        return
+    step = -(-len(data) // chunks)
+    bounds = [(lo, min(lo + step, len(data)))
+              for lo in range(0, len(data), step)]
+    with ProcessPoolExecutor(max_workers=chunks) as executor:
+        if (isinstance(data, array)
+                and data.typecode in SHAREABLE_TYPECODES):
+            _sort_shared(data, bounds, executor)
+        else:
+            runs = list(executor.map(
+                _sort_chunk, [data[lo:hi] for lo, hi in bounds]
+            ))
+            merged = merge(*runs)
+            if isinstance(data, array):
+                merged = array(data.typecode, merged)
+            data[:] = merged
+
+
+def _sort_chunk(chunk):
+    """Sort a chunk in a worker process and send it back."""
+    merge_sort(chunk, 0, len(chunk) - 1)
+    return chunk
+
+
+def _sort_shared(data, bounds, executor):
+    """Sort an array through a shared memory block."""
+    block = shared_memory.SharedMemory(
+        create=True, size=len(data) * data.itemsize
+    )
+    try:
+        view = block.buf.cast(data.typecode)
+        try:
+            view[:] = data
+            futures = [
+                executor.submit(_sort_shared_chunk, block.name,
+                                data.typecode, lo, hi)
+                for lo, hi in bounds
+            ]
+            for future in futures:
+                future.result()
+            data[:] = array(data.typecode,
+                            merge(*(view[lo:hi] for lo, hi in bounds)))
+        finally:
+            view.release()
+    finally:
+        block.close()
+        block.unlink()
+
+
+def _sort_shared_chunk(name, typecode, lo, hi):
+    """Sort the elements lo to hi of a shared array in a worker process."""
+    block = shared_memory.SharedMemory(name=name)
+    view = block.buf.cast(typecode)
+    try:
+        chunk = view[lo:hi].tolist()
+        merge_sort(chunk, 0, len(chunk) - 1)
+        view[lo:hi] = array(typecode, chunk)
+    finally:
+        view.release()
+        block.close()
+
+
+if __name__ == "__main__":
+    import random
+
+    data = array("d", (random.random() for _ in range(20000)))
+    parallel_merge_sort(data, workers=4)
+    print(all(data[i] <= data[i + 1] for i in range(len(data) - 1)))
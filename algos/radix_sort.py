@@ -0,0 +1,237 @@
+from array import array
+from numbers import Integral
+
+from decorate import decorate_sort
+from merge_sort import merge_sort
+
+
+# Number of key bits sorted per pass of radix_sort.
+RADIX_BITS = 8
+
+# Length below which msd_radix_sort finishes a bucket by insertion sort.
+MSD_CUTOFF = 32
+
+# Array typecodes whose elements are always integers.
+INTEGER_TYPECODES = "bBhHiIlLqQ"
+
+
+def counting_sort(data, key=None, reverse=False, scratch=None):
+    """Implements the counting sort algorithm for integer keys.
+
+    data is a list, an array or a writable buffer such as a memoryview.
+    The elements, or key(element) if key is given, must be integers;
+    otherwise data is sorted by merge_sort. The elements are counted per
+    key, so time and memory grow with the range of the keys; when that
+    range is wider than data is long, radix_sort is used instead. If
+    reverse is set the keys are sorted in descending order.
+
+    scratch, a sequence of the same type as data and at least as long, is
+    used for the output of the pass and may be reused between calls.
+    Sorts in place and is stable.
+    """
+    keys = data if key is None else [key(x) for x in data]
+    if not _integers(data, keys):
+        _fallback(data, keys, reverse)
+        return
+    if len(data) < 2:
+        return
+    lo, hi = min(keys), max(keys)
+    if hi - lo >= max(len(data), 1 << RADIX_BITS):
+        _radix_sort(data, keys, reverse, scratch)
+        return
+    scratch = _scratch(data, scratch)
+    if reverse:
+        digits = [hi - k for k in keys]
+    else:
+        digits = [k - lo for k in keys]
+    _distribute(digits, hi - lo + 1, [data], [scratch])
+    data[:] = scratch[:len(data)]
+
+
+def radix_sort(data, key=None, reverse=False, scratch=None):
+    """Implements the least significant digit radix sort for integer keys.
+
+    data is a list, an array or a writable buffer such as a memoryview.
+    The elements, or key(element) if key is given, must be integers of any
+    sign and size; otherwise data is sorted by merge_sort. Keys are offset
+    by the smallest one and distributed RADIX_BITS bits at a time, so the
+    number of passes depends on the range of the keys, not their number.
+    If reverse is set keys are offset from the largest one instead, which
+    sorts them in descending order.
+
+    scratch, a sequence of the same type as data and at least as long, is
+    used for alternate passes and may be reused between calls. Sorts in
+    place and is stable.
+    """
+    keys = data if key is None else [key(x) for x in data]
+    if not _integers(data, keys):
+        _fallback(data, keys, reverse)
+        return
+    _radix_sort(data, keys, reverse, scratch)
+
+
+def _radix_sort(data, keys, reverse, scratch):
+    """Implements radix_sort for data with the integer keys keys.
+
+    keys is data itself if the elements are their own keys.
+    """
+    size = len(data)
+    if size < 2:
+        return
+    lo, hi = min(keys), max(keys)
+    span = (hi - lo).bit_length()
+    scratch = _scratch(data, scratch)
+    mask = (1 << RADIX_BITS) - 1
+    sources, targets = [data], [scratch]
+    if keys is not data:
+        sources.append(keys)
+        targets.append([0] * size)
+    for shift in range(0, span, RADIX_BITS):
+        # scratch may be longer than data; only its first size elements count.
+        current = sources[-1][:size]
+        if reverse:
+            digits = [(hi - k) >> shift & mask for k in current]
+        else:
+            digits = [(k - lo) >> shift & mask for k in current]
+        if digits.count(digits[0]) == size:
+            continue
+        _distribute(digits, mask + 1, sources, targets)
+        sources, targets = targets, sources
+    if sources[0] is not data:
+        data[:] = scratch[:size]
+
+
+def msd_radix_sort(data, key=None, reverse=False, scratch=None):
+    """Implements the most significant digit radix sort for byte strings.
+
+    The elements, or key(element) if key is given, must be bytes-like
+    keys of one and the same length; otherwise data is sorted by
+    merge_sort. Elements are distributed into 256 buckets by their first
+    byte, every bucket by the next byte and so on, and buckets shorter
+    than MSD_CUTOFF are finished by insertion sort. If reverse is set the
+    keys are sorted in descending order.
+
+    scratch, a sequence of the same type as data and at least as long, is
+    used for the distribution and may be reused between calls. Sorts in
+    place and is stable.
+    """
+    keys = data if key is None else [key(x) for x in data]
+    size = len(data)
+    if size < 2:
+        return
+    if (not all(isinstance(k, (bytes, bytearray, memoryview)) for k in keys)
+            or len(set(map(len, keys))) != 1):
+        _fallback(data, keys, reverse)
+        return
+    width = len(keys[0])
+    if not width:
+        return
+    scratch = _scratch(data, scratch)
+    sources, targets = [data], [scratch]
+    if key is not None:
+        sources.append(keys)
+        targets.append([None] * size)
+    stack = [(0, size, 0)]
+    while stack:
+        lo, hi, depth = stack.pop()
+        if hi - lo < MSD_CUTOFF:
+            _insertion_sort(sources, lo, hi, reverse)
+            continue
+        if reverse:
+            digits = [255 - k[depth] for k in sources[-1][lo:hi]]
+        else:
+            digits = [k[depth] for k in sources[-1][lo:hi]]
+        starts = _distribute(digits, 256, sources, targets, lo)
+        for source, target in zip(sources, targets):
+            source[lo:hi] = target[lo:hi]
+        if depth + 1 < width:
+            ends = starts[1:] + [hi]
+            stack.extend((start, end, depth + 1)
+                         for start, end in zip(starts, ends)
+                         if end - start > 1)
+
+
+def _integers(data, keys):
+    """Return whether keys, the keys of data, are all integers."""
+    if keys is data and (isinstance(data, array)
+                         and data.typecode in INTEGER_TYPECODES
+                         or isinstance(data, bytearray)):
+        return True
+    return all(isinstance(k, Integral) for k in keys)
+
+
+def _scratch(data, scratch):
+    """Return scratch, or a new sequence like data if it is None."""
+    if scratch is None:
+        if isinstance(data, memoryview):
+            return array(data.format, data.tobytes())
+        return data[:]
+    if len(scratch) < len(data):
+        raise ValueError("scratch must be at least as long as data.")
+    return scratch
+
+
+def _distribute(digits, size, sources, targets, offset=0):
+    """Stably move the elements of every source to its target by digit.
+
+    digits holds one digit in range(size) per element, and the elements
+    are written from position offset on. Returns the start of each digit.
+    """
+    starts = [0] * size
+    for digit in digits:
+        starts[digit] += 1
+    total = offset
+    for digit, count in enumerate(starts):
+        starts[digit] = total
+        total += count
+    for source, target in zip(sources, targets):
+        positions = starts[:]
+        for digit, element in zip(digits, source[offset:offset + len(digits)]):
+            target[positions[digit]] = element
+            positions[digit] += 1
+    return starts
+
+
+def _insertion_sort(sources, lo, hi, reverse):
+    """Sort sources[0][lo:hi] by sources[-1] and move all sources alike."""
+    keys = sources[-1]
+    for k in range(lo + 1, hi):
+        current = [source[k] for source in sources]
+        j = k
+        while j > lo and (keys[j - 1] < current[-1] if reverse
+                          else keys[j - 1] > current[-1]):
+            for source in sources:
+                source[j] = source[j - 1]
+            j -= 1
+        for source, element in zip(sources, current):
+            source[j] = element
+
+
+def _fallback(data, keys, reverse):
+    """Sort data by merge_sort on the keys computed already.
+
+    keys is data itself if the elements are their own keys. Otherwise, and
+    for memoryviews, whose slices are views rather than copies that
+    merge_sort could merge from, the elements are sorted as a decorated
+    list, so the key isn't called again.
+    """
+    if keys is data and not isinstance(data, memoryview):
+        merge_sort(data, 0, len(data) - 1, None, reverse)
+    else:
+        decorate_sort(data, 0, len(data), None, reverse,
+                      lambda pairs: merge_sort(pairs, 0, len(pairs) - 1),
+                      keys)
+
+
+if __name__ == "__main__":
+    import random
+
+    data = array("q", (random.randrange(-2**40, 2**40) for _ in range(10000)))
+    radix_sort(data)
+    print(list(data) == sorted(data))
+    data = [random.randbytes(4) for _ in range(10000)]
+    msd_radix_sort(data)
+    print(data == sorted(data))
+    data = [3, 1, 2, 1, 0]
+    counting_sort(data)
+    print(data)
@@ -0,0 +1,149 @@
+from heapq import nlargest, nsmallest
+
+from decorate import decorate_sort
+from insertion_sort import insertion_sort
+from merge_sort import merge_sort
+
+
+# Length below which nth_element finishes by insertion sort.
+SELECT_CUTOFF = 16
+
+
+def nth_element(data, n, lo=0, hi=None, key=None, reverse=False):
+    """Implements the introselect algorithm.
+
+    Rearranges data[lo:hi] in place so that data[n] is the element a full
+    sort would put there, no element before it is greater and no element
+    after it is smaller. Partitions three ways around a median-of-three
+    pivot like quickselect, which takes expected linear time; if that makes
+    too little progress, pivots are chosen by the median of medians
+    instead, so the worst case is linear too.
+
+    Elements are compared by key(element) if key is given, computing the
+    key once per element, and the order is descending if reverse is set.
+    """
+    if hi is None:
+        hi = len(data)
+    if not lo <= n < hi:
+        raise IndexError("n is out of range.")
+    if key is not None or reverse:
+        # Reversed results are read backwards, so select from the end.
+        rank = hi - 1 - n if reverse else n - lo
+        decorate_sort(data, lo, hi, key, reverse,
+                      lambda pairs: nth_element(pairs, rank))
+        return
+    budget = 2 * (hi - lo).bit_length()
+    while hi - lo > SELECT_CUTOFF:
+        if budget:
+            budget -= 1
+            pivot = _median_of_three(data[lo], data[(lo + hi) // 2],
+                                     data[hi - 1])
+        else:
+            pivot = _median_of_medians(data, lo, hi)
+        lt, gt = _partition(data, lo, hi, pivot)
+        if n < lt:
+            hi = lt
+        elif n >= gt:
+            lo = gt
+        else:
+            return
+    insertion_sort(data, lo, hi)
+
+
+def partial_sort(data, k, key=None, reverse=False):
+    """Sorts the k smallest elements of data into data[:k].
+
+    The remaining elements are left in data[k:] in no particular order.
+    nth_element moves the k smallest elements to the front in linear time
+    and only those are then sorted by merge_sort, so the cost is
+    O(n + k log k). key and reverse work as for merge_sort. The elements
+    are selected as pairs of their key and position, which nth_element
+    can't reorder among equal keys, so the result is stable.
+    """
+    k = max(0, min(k, len(data)))
+    # Reversed results are read backwards, so sort the last k pairs.
+    start = len(data) - k if reverse else 0
+    decorate_sort(data, 0, len(data), key, reverse,
+                  lambda pairs: _sort_ranks(pairs, start, start + k))
+
+
+def top_k(iterable, k, key=None, reverse=False):
+    """Returns a list of the k smallest items of iterable in sorted order.
+
+    The result equals sorted(iterable, key=key, reverse=reverse)[:k], so
+    reverse gives the k largest items. heapq.nsmallest and heapq.nlargest
+    consume the items one at a time and keep only the best k seen so far
+    in a heap, so iterable may be an unbounded stream: memory is O(k) and
+    time O(n log k). The key is computed once per item.
+    """
+    if reverse:
+        return nlargest(k, iterable, key)
+    return nsmallest(k, iterable, key)
+
+
+def _sort_ranks(data, start, stop):
+    """Sort the elements of ranks start to stop - 1 into data[start:stop]."""
+    if start >= stop:
+        return
+    if stop < len(data):
+        nth_element(data, stop - 1)
+    if start > 0:
+        nth_element(data, start, 0, stop)
+    merge_sort(data, start, stop - 1)
+
+
+def _median_of_three(a, b, c):
+    """Return the median of three elements."""
+    if a < b:
+        if b < c:
+            return b
+        return c if a < c else a
+    if a < c:
+        return a
+    return c if b < c else b
+
+
+def _median_of_medians(data, lo, hi):
+    """Return a pivot with at least 3/10 of data[lo:hi] on either side."""
+    medians = []
+    for start in range(lo, hi, 5):
+        group = list(data[start:min(start + 5, hi)])
+        insertion_sort(group)
+        medians.append(group[(len(group) - 1) // 2])
+    middle = (len(medians) - 1) // 2
+    nth_element(medians, middle)
+    return medians[middle]
+
+
+def _partition(data, lo, hi, pivot):
+    """Partition data[lo:hi] three ways around pivot.
+
+    Returns lt and gt such that data[lo:lt] is smaller than pivot,
+    data[lt:gt] equal to it and data[gt:hi] greater.
+    """
+    lt, i, gt = lo, lo, hi
+    while i < gt:
+        element = data[i]
+        if element < pivot:
+            data[i] = data[lt]
+            data[lt] = element
+            lt += 1
+            i += 1
+        elif pivot < element:
+            gt -= 1
+            data[i] = data[gt]
+            data[gt] = element
+        else:
+            i += 1
+    return lt, gt
+
+
+if __name__ == "__main__":
+    import random
+
+    data = [random.randrange(100) for _ in range(1000)]
+    nth_element(data, 500)
+    print(data[500] == sorted(data)[500])
+    partial_sort(data, 10)
+    print(data[:10])
+    print(top_k(iter(data), 5, reverse=True))
@@ -0,0 +1,178 @@
+from array import array
+import mmap
+from operator import add, mul
+import struct
+
+from matrix import Matrix
+
+
+# Edge of the square tiles streamed through memory by multiply_to().
+TILE_SIZE = 256
+
+
+class MappedMatrix(Matrix):
+    """A matrix whose elements live in a memory-mapped binary file.
+
+    The file starts with a fixed-size header holding a magic number, the
+    shape and the element type, followed by the elements as row-major
+    doubles. Opening a file maps it without reading it, so the operating
+    system pages elements in only when they are touched.
+
+    Indexing works as for Matrix. The + and * operators return an
+    in-memory Matrix; add_to() and multiply_to() stream the operands tile
+    by tile and write the result to another mapped file instead.
+    """
+
+    header = struct.Struct("<4s4xQQ8s")
+    magic = b"MTRX"
+    typecode = "d"
+
+    def __init__(self, path, writable=False):
+        """Map an existing matrix file, read-only unless writable is set."""
+        self._path = path
+        self._file = open(path, "r+b" if writable else "rb")
+        try:
+            access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=access)
+        except Exception:
+            self._file.close()
+            raise
+        if len(self._mmap) < self.header.size:
+            self.close()
+            raise ValueError(f"{path} is not a matrix file.")
+        magic, rows, columns, typecode = self.header.unpack_from(self._mmap)
+        if (magic != self.magic
+                or typecode.rstrip(b"\0").decode() != self.typecode):
+            self.close()
+            raise ValueError(f"{path} is not a matrix file.")
+        self._rows = rows
+        self._columns = columns
+        self._map_views()
+        self._lu = None
+        if len(self._data) != rows * columns:
+            self.close()
+            raise ValueError(f"{path} is truncated.")
+
+    @classmethod
+    def create(cls, path, rows, columns):
+        """Create a zero-filled rows x columns matrix file and map it."""
+        with open(path, "wb") as file:
+            file.write(cls.header.pack(cls.magic, rows, columns,
+                                       cls.typecode.encode()))
+            file.truncate(cls.header.size
+                          + rows * columns * array(cls.typecode).itemsize)
+        return cls(path, writable=True)
+
+    @classmethod
+    def from_matrix(cls, path, matrix):
+        """Write matrix to a new file and return it mapped."""
+        result = cls.create(path, matrix._rows, matrix._columns)
+        result._data[:] = array(cls.typecode, matrix._data)
+        return result
+
+    @classmethod
+    def _from_flat(cls, rows, columns, data):
+        """Results of the inherited operators are in-memory matricies."""
+        return Matrix._from_flat(rows, columns, data)
+
+    def __repr__(self):
+        """Return the representation of the matrix."""
+        return f"{self.__class__.__name__}({self._path!r})"
+
+    def flush(self):
+        """Write changes of the mapping back to the file."""
+        self._mmap.flush()
+
+    def _map_views(self):
+        """Create the views of the mapping the elements are accessed by."""
+        self._view = memoryview(self._mmap)[self.header.size:]
+        self._data = self._view.cast(self.typecode)
+
+    def close(self):
+        """Unmap the file. The matrix can't be used afterwards.
+
+        While a view returned by buffer() is alive the mapping can't be
+        closed; BufferError is raised then and the matrix stays open.
+        """
+        views = (getattr(self, "_data", None), getattr(self, "_view", None))
+        for view in views:
+            if view is not None:
+                view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            if views[0] is not None:
+                self._map_views()
+            raise BufferError("Can't close a matrix while a view of its "
+                              "buffer is alive.") from None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add_to(self, other, path):
+        """Add other to the matrix and write the sum to a file at path.
+
+        Rows are streamed in bands so that only one band of each operand
+        is resident at a time.
+        """
+        if self._rows != other._rows or self._columns != other._columns:
+            raise ValueError("Can't add matricies with different dimensions.")
+        result = self.create(path, self._rows, self._columns)
+        band = TILE_SIZE * TILE_SIZE
+        a, b, c = self._data, other._data, result._data
+        for start in range(0, len(c), band):
+            stop = min(start + band, len(c))
+            c[start:stop] = array(self.typecode,
+                                  map(add, a[start:stop], b[start:stop]))
+        result.flush()
+        return result
+
+    def multiply_to(self, other, path, tile_size=None):
+        """Multiply the matrix by other and write the product to path.
+
+        The product is computed one tile_size x tile_size tile at a time
+        from matching tiles of the operands, so memory use depends on the
+        tile size only.
+        """
+        if self._columns != other._rows:
+            raise ValueError("Inappropriate sizes of matricies.")
+        tile = TILE_SIZE if tile_size is None else tile_size
+        if tile < 1:
+            raise ValueError("tile_size must be a positive integer.")
+        n, m, p = self._rows, self._columns, other._columns
+        result = self.create(path, n, p)
+        a, b, c = self._data, other._data, result._data
+        for i0 in range(0, n, tile):
+            i1 = min(i0 + tile, n)
+            for j0 in range(0, p, tile):
+                j1 = min(j0 + tile, p)
+                block = [[0.0] * (j1 - j0) for _ in range(i0, i1)]
+                for k0 in range(0, m, tile):
+                    k1 = min(k0 + tile, m)
+                    b_columns = [list(b[k0 * p + j:k1 * p:p])
+                                 for j in range(j0, j1)]
+                    for i, row in zip(range(i0, i1), block):
+                        a_part = list(a[i * m + k0:i * m + k1])
+                        row[:] = map(add, row, [sum(map(mul, a_part, column))
+                                                for column in b_columns])
+                for i, row in zip(range(i0, i1), block):
+                    c[i * p + j0:i * p + j1] = array(self.typecode, row)
+        result.flush()
+        return result
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    directory = tempfile.mkdtemp()
+    left = MappedMatrix.from_matrix(os.path.join(directory, "left.mtx"),
+                                    Matrix([[1, 2], [3, 4]]))
+    right = MappedMatrix.from_matrix(os.path.join(directory, "right.mtx"),
+                                     Matrix([[2, 1, 3], [0, 0, 1]]))
+    with left.multiply_to(right, os.path.join(directory, "product.mtx")) as product:
+        print(product)
@@ -1,53 +1,780 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from itertools import islice, repeat
+from numbers import Real
+from operator import add, mul, sub
+import os
+
+try:
+    import numpy
+except ImportError:     # the pure Python kernels are used instead
+    numpy = None
+
+
+# Default tile edge for the blocked kernel and the matrix size at and below
+# which Strassen recursion hands over to the classic kernel.
+BLOCK_SIZE = 64
+STRASSEN_CUTOFF = 64
+
+# Number of elements written at a time by the pure Python in-place kernels.
+_CHUNK_SIZE = 4096
+
+
 class Matrix:
-    """The class is an implementation of the mathematical concept of matrix."""
+    """The class is an implementation of the mathematical concept of matrix.
+
+    Elements are kept in a flat row-major array of doubles, so the element
+    at (i, j) lives at position i * columns + j of the backing store.
+    """
+
+    # Set once the store has been handed out through buffer() or
+    # __array__(), after which writes may happen behind the matrix's back.
+    _exported = False
 
     def __init__(self, data_set):
         """Create a new matrix instance."""
-        self._matrix = data_set
-        self._rows = len(self._matrix)
-        self._columns = len(self._matrix[0])
+        self._rows = len(data_set)
+        self._columns = len(data_set[0])
+        self._data = array("d")
+        for row in data_set:
+            if len(row) != self._columns:
+                raise ValueError("All rows of a matrix must have equal length.")
+            self._data.extend(row)
+        self._lu = None
+
+    @classmethod
+    def _from_flat(cls, rows, columns, data):
+        """Create a matrix of the given shape around a row-major store."""
+        matrix = cls.__new__(cls)
+        matrix._rows = rows
+        matrix._columns = columns
+        matrix._data = data
+        matrix._lu = None
+        return matrix
+
+    @classmethod
+    def frombuffer(cls, buffer, rows=None, columns=None):
+        """Create a matrix sharing memory with a buffer of doubles.
+
+        buffer is any C-contiguous object supporting the buffer protocol
+        with elements of format 'd', such as array('d'), a memoryview or
+        a float64 NumPy array. The shape is taken from a two-dimensional
+        buffer unless rows and columns are given. No elements are copied,
+        so changes through either object are visible in the other.
+        """
+        view = memoryview(buffer)
+        if view.format != "d":
+            raise TypeError(f"buffer elements must be doubles, not "
+                            f"{view.format!r}")
+        if rows is None or columns is None:
+            if view.ndim != 2:
+                raise ValueError("rows and columns are required for a "
+                                 "buffer that is not two-dimensional.")
+            rows, columns = view.shape
+        data = view.cast("B").cast("d")
+        if len(data) != rows * columns:
+            raise ValueError("Buffer size doesn't match the matrix shape.")
+        return cls._from_flat(rows, columns, data)
+
+    def buffer(self):
+        """Return a two-dimensional memoryview of the elements."""
+        self._exported = True
+        self._lu = None
+        return memoryview(self._data).cast("B").cast(
+            "d", (self._rows, self._columns)
+        )
+
+    def __buffer__(self, flags):
+        """Export the elements through the buffer protocol."""
+        return self.buffer()
+
+    def __array__(self, dtype=None, copy=None):
+        """Return the elements as a NumPy array sharing the memory."""
+        if numpy is None:
+            raise ImportError("NumPy is required to convert a matrix to an "
+                              "array.")
+        result = _as_ndarray(self)
+        if dtype is not None and result.dtype != dtype:
+            return result.astype(dtype)
+        if copy:
+            return result.copy()
+        self._exported = True
+        self._lu = None
+        return result
+
+    @classmethod
+    def identity(cls, size):
+        """Create a size x size identity matrix."""
+        data = _empty(size * size)
+        data[::size + 1] = array("d", [1.0] * size)
+        return cls._from_flat(size, size, data)
+
+    def _row(self, i):
+        """Return the i-th row of the backing store."""
+        start = i * self._columns
+        return self._data[start:start + self._columns]
+
+    def tolist(self):
+        """Return the elements of the matrix as a list of lists."""
+        return [self._row(i).tolist() for i in range(self._rows)]
 
     def __str__(self):
         """Return the string representation of the matrix."""
-        return str(self._matrix)
+        return str(self.tolist())
 
     def __repr__(self):
         """Return the representation of the matrix."""
-        return f"{self.__class__.__name__}({self._matrix})"
-        
+        return f"{self.__class__.__name__}({self.tolist()})"
+
+    def _offset(self, indexes):
+        """Return the position of the element at indexes in the store."""
+        i, j = indexes
+        if i < 0:
+            i += self._rows
+        if j < 0:
+            j += self._columns
+        if not (0 <= i < self._rows and 0 <= j < self._columns):
+            raise IndexError(f"{self.__class__.__name__} index out of range")
+        return i * self._columns + j
+
     def __getitem__(self, indexes):
         """Return the element of the matrix with specified indexes"""
-        return self._matrix[indexes[0]][indexes[1]]
+        return self._data[self._offset(indexes)]
 
     def __setitem__(self, indexes, value):
         """Set the value of the element at indexes indexes."""
-        self._matrix[indexes[0]][indexes[1]] = value
+        self._data[self._offset(indexes)] = value
+        self._lu = None
+
+    def _check_out(self, out, rows, columns):
+        """Return a store for a rows x columns result and the result matrix.
+
+        A new store is allocated unless out, a Matrix of that shape, is
+        given to receive the result.
+        """
+        if out is None:
+            data = _empty(rows * columns)
+            return data, self._from_flat(rows, columns, data)
+        if out._rows != rows or out._columns != columns:
+            raise ValueError("Inappropriate size of the output matrix.")
+        out._lu = None
+        return out._data, out
+
+    def _elementwise(self, name, ufunc, function, other, out):
+        """Apply the element-wise operation name to the matrix and other."""
+        if self._rows != other._rows or self._columns != other._columns:
+            raise ValueError(f"Can't {name} matricies with different "
+                             f"dimensions.")
+        data, result = self._check_out(out, self._rows, self._columns)
+        if numpy is not None:
+            ufunc(_as_ndarray(self), _as_ndarray(other),
+                  out=_as_ndarray(result))
+        else:
+            _write(data, map(function, self._data, other._data))
+        return result
+
+    def add(self, other, out=None):
+        """Return the sum of the matrix and other.
+
+        If out is given the sum is written into it and out is returned.
+        """
+        return self._elementwise("add", numpy and numpy.add, add, other, out)
+
+    def subtract(self, other, out=None):
+        """Return the difference of the matrix and other.
+
+        If out is given the difference is written into it and out is
+        returned.
+        """
+        return self._elementwise("subtract", numpy and numpy.subtract, sub,
+                                 other, out)
+
+    def scale(self, factor, out=None):
+        """Return the matrix multiplied by the number factor.
+
+        If out is given the result is written into it and out is returned.
+        """
+        data, result = self._check_out(out, self._rows, self._columns)
+        if numpy is not None:
+            numpy.multiply(_as_ndarray(self), factor, out=_as_ndarray(result))
+        else:
+            _write(data, map(mul, self._data, repeat(factor)))
+        return result
 
     def __add__(self, other):
         """Return the result of the two matrix addition."""
-        if self._rows != other._rows or self._columns != other._columns:
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.add(other)
+
+    def __sub__(self, other):
+        """Return the result of the two matrix subtraction."""
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.subtract(other)
+
+    def __iadd__(self, other):
+        """Add other to the matrix in place."""
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.add(other, out=self)
+
+    def __isub__(self, other):
+        """Subtract other from the matrix in place."""
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.subtract(other, out=self)
+
+    def __mul__(self, other):
+        """Return the result of matrix or scalar multiplication."""
+        if isinstance(other, Real):
+            return self.scale(other)
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.multiply(other)
+
+    def __rmul__(self, other):
+        """Return the result of scalar multiplication."""
+        if not isinstance(other, Real):
+            return NotImplemented
+        return self.scale(other)
+
+    def __imul__(self, other):
+        """Multiply the matrix by a number in place."""
+        if not isinstance(other, Real):
+            return NotImplemented
+        return self.scale(other, out=self)
+
+    def __pow__(self, exponent):
+        """Raise a square matrix to an integer power by repeated squaring.
+
+        Negative exponents are powers of the inverse matrix.
+        """
+        if self._rows != self._columns:
+            raise ValueError("Only square matricies can be raised to a power.")
+        if exponent < 0:
+            return self.inverse() ** -exponent
+        result = None
+        base = self
+        while exponent:
+            if exponent & 1:
+                if result is None:
+                    # Never hand out the operand itself as the power.
+                    result = (self._from_flat(self._rows, self._columns,
+                                              array("d", base._data))
+                              if base is self else base)
+                else:
+                    result = result * base
+            exponent >>= 1
+            if exponent:
+                base = base * base
+        return self.identity(self._rows) if result is None else result
+
+    def _factorize(self):
+        """Return the cached LU decomposition with partial pivoting.
+
+        The result is a tuple (lu, permutation, sign): lu holds the rows of
+        the unit lower triangular factor below the diagonal and the upper
+        triangular factor on and above it, row i of the factored matrix is
+        row permutation[i] of the original one and sign is the parity of the
+        permutation. Assigning an element drops the cached decomposition.
+
+        The decomposition isn't cached if the elements live in memory that
+        can be written through other objects, i.e. for matricies created by
+        frombuffer() or exported by buffer() or __array__().
+        """
+        if self._lu is not None:
+            return self._lu
+        if self._rows != self._columns:
+            raise ValueError("Only square matricies can be factorized.")
+        n = self._rows
+        lu = [list(self._row(i)) for i in range(n)]
+        permutation = list(range(n))
+        sign = 1
+        for k in range(n):
+            pivot = max(range(k, n), key=lambda i: abs(lu[i][k]))
+            if lu[pivot][k] == 0:
+                sign = 0
+                continue
+            if pivot != k:
+                lu[k], lu[pivot] = lu[pivot], lu[k]
+                permutation[k], permutation[pivot] = (permutation[pivot],
+                                                      permutation[k])
+                sign = -sign
+            pivot_row = lu[k][k + 1:]
+            for row in lu[k + 1:]:
+                factor = row[k] / lu[k][k]
+                row[k] = factor
+                if factor:
+                    row[k + 1:] = [x - factor * y
+                                   for x, y in zip(row[k + 1:], pivot_row)]
+        factorization = lu, permutation, sign
+        if not self._exported and not isinstance(self._data, memoryview):
+            self._lu = factorization
+        return factorization
+
+    def det(self):
+        """Return the determinant of a square matrix."""
+        lu, _, sign = self._factorize()
+        result = float(sign)
+        for i, row in enumerate(lu):
+            result *= row[i]
+        return result
+
+    def _solve_vector(self, b):
+        """Return x such that the matrix times x equals the sequence b."""
+        lu, permutation, sign = self._factorize()
+        if sign == 0:
+            raise ValueError("Matrix is singular.")
+        n = self._rows
+        y = []
+        for i in range(n):
+            y.append(b[permutation[i]] - sum(map(mul, lu[i][:i], y)))
+        x = [0.0] * n
+        for i in range(n - 1, -1, -1):
+            row = lu[i]
+            x[i] = (y[i] - sum(map(mul, row[i + 1:], x[i + 1:]))) / row[i]
+        return x
+
+    def solve(self, b):
+        """Solve the linear system with the matrix as coefficients.
+
+        b is either a sequence, giving the solution as a list, or a Matrix
+        whose columns are right-hand sides, giving a Matrix of solutions.
+        The decomposition is computed once, so each further right-hand
+        side costs O(n^2).
+        """
+        if not isinstance(b, Matrix):
+            if len(b) != self._rows:
+                raise ValueError("Inappropriate size of the right-hand side.")
+            return self._solve_vector(b)
+        if b._rows != self._rows:
+            raise ValueError("Inappropriate size of the right-hand side.")
+        columns = [self._solve_vector(column)
+                   for column in _transpose(b._data, b._rows, b._columns)]
+        data = array("d")
+        for row in zip(*columns):
+            data.extend(row)
+        return self._from_flat(self._columns, b._columns, data)
+
+    def inverse(self):
+        """Return the inverse of a square matrix."""
+        return self.solve(self.identity(self._rows))
+
+    def lazy(self):
+        """Return the matrix as a leaf of a lazily evaluated expression."""
+        return LazyMatrix(None, (self,), self._rows, self._columns)
+
+    def multiply(self, other, method=None, cutoff=None, out=None):
+        """Return the product of the matrix and other.
+
+        method    'naive' for the classic kernel, 'blocked' for the tiled
+                  kernel, 'strassen' for recursive Strassen multiplication
+                  or 'numpy' for numpy.matmul; by default 'numpy' when
+                  NumPy can be imported and 'naive' otherwise
+        cutoff    tile edge for 'blocked', or the size at which 'strassen'
+                  falls back to the classic kernel
+        out       a Matrix, other than the operands, to receive the product
+        """
+        if method is None:
+            method = "naive" if numpy is None else "numpy"
+        if self._columns != other._rows:
+            raise ValueError("Inappropriate sizes of matricies.")
+        if cutoff is not None and cutoff < 1:
+            raise ValueError("cutoff must be a positive integer.")
+        if out is self or out is other:
+            raise ValueError("The output matrix can't be an operand.")
+        shape = self._rows, self._columns, other._columns
+        data, result = self._check_out(out, self._rows, other._columns)
+        if method == "numpy":
+            if numpy is None:
+                raise ValueError("The 'numpy' method requires NumPy.")
+            numpy.matmul(_as_ndarray(self), _as_ndarray(other),
+                         out=_as_ndarray(result))
+        elif method == "naive":
+            _naive_kernel(self._data, other._data, *shape, data)
+        elif method == "blocked":
+            block = BLOCK_SIZE if cutoff is None else cutoff
+            data[:] = _blocked_kernel(self._data, other._data, *shape, block)
+        elif method == "strassen":
+            crossover = STRASSEN_CUTOFF if cutoff is None else cutoff
+            data[:] = _strassen_product(
+                self._data, other._data, *shape, crossover
+            )
+        else:
+            raise ValueError(f"Unknown multiplication method: {method!r}.")
+        return result
+
+    def matmul_parallel(self, other, workers=None):
+        """Return the product of the matrix and other computed in parallel.
+
+        The rows of the product are split into one band per worker process.
+        Both operands and the product live in shared memory, so the workers
+        read and write them directly instead of receiving pickled copies.
+        """
+        if self._columns != other._rows:
+            raise ValueError("Inappropriate sizes of matricies.")
+        n, m, p = self._rows, self._columns, other._columns
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers must be a positive integer.")
+        itemsize = array("d").itemsize
+        blocks = []
+        try:
+            for data, length in ((self._data, n * m), (other._data, m * p),
+                                 (None, n * p)):
+                block = shared_memory.SharedMemory(
+                    create=True, size=max(length, 1) * itemsize
+                )
+                blocks.append(block)
+                if data is not None:
+                    view = block.buf.cast("d")
+                    view[:length] = array("d", data)
+                    view.release()
+            band = -(-n // workers)
+            names = [block.name for block in blocks]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_multiply_rows, names, n, m, p, start,
+                                    min(start + band, n))
+                    for start in range(0, n, band)
+                ]
+                for future in futures:
+                    future.result()
+            view = blocks[2].buf.cast("d")
+            product = array("d", view[:n * p])
+            view.release()
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+        return self._from_flat(n, p, product)
+
+
+class LazyMatrix:
+    """A node of a lazily evaluated matrix expression.
+
+    Adding or multiplying lazy matrices (or a lazy matrix and a Matrix)
+    only records the operation. Nested sums and products are flattened, so
+    A * B * C is a single product node with three factors. Calling
+    evaluate() multiplies every chain in the cheapest order and writes each
+    sum in one pass over all of its terms.
+    """
+
+    __slots__ = "_operation", "_operands", "_rows", "_columns"
+
+    def __init__(self, operation, operands, rows, columns):
+        """Create a node applying operation ('+', '*' or None) to operands."""
+        self._operation = operation
+        self._operands = operands
+        self._rows = rows
+        self._columns = columns
+
+    def __repr__(self):
+        """Return the representation of the expression."""
+        if self._operation is None:
+            return f"{self._operands[0]!r}.lazy()"
+        return "(" + f" {self._operation} ".join(map(repr, self._operands)) + ")"
+
+    @property
+    def shape(self):
+        """Return the (rows, columns) shape of the result."""
+        return self._rows, self._columns
+
+    def _combine(self, operation, left, right, rows, columns):
+        """Return a node applying operation to left and right."""
+        operands = []
+        for operand in left, right:
+            if operand._operation == operation:
+                operands.extend(operand._operands)
+            else:
+                operands.append(operand)
+        return self.__class__(operation, tuple(operands), rows, columns)
+
+    def __add__(self, other):
+        """Record the addition of other."""
+        other = _as_lazy(other)
+        if other is None:
+            return NotImplemented
+        if self.shape != other.shape:
             raise ValueError("Can't add matricies with different dimensions.")
-        result = []
-        for line0, line1 in zip(self._matrix, other._matrix):
-            result.append([i + j for i, j in zip(line0, line1)])
-        return self.__class__(result)
+        return self._combine("+", self, other, self._rows, self._columns)
+
+    def __radd__(self, other):
+        """Record the addition of the expression to other."""
+        other = _as_lazy(other)
+        if other is None:
+            return NotImplemented
+        return other + self
 
     def __mul__(self, other):
-        """Return the result of matrix multiplication."""
+        """Record the multiplication by other."""
+        other = _as_lazy(other)
+        if other is None:
+            return NotImplemented
         if self._columns != other._rows:
             raise ValueError("Inappropriate sizes of matricies.")
-        product = self.__class__(
-            [[0] * other._columns for i in range(self._rows)]
+        return self._combine("*", self, other, self._rows, other._columns)
+
+    def __rmul__(self, other):
+        """Record the multiplication of other by the expression."""
+        other = _as_lazy(other)
+        if other is None:
+            return NotImplemented
+        return other * self
+
+    def evaluate(self):
+        """Compute the expression and return the resulting Matrix.
+
+        A subexpression used several times is computed once. The result is
+        a new matrix, even if the expression is a single leaf.
+        """
+        result = self._evaluate({})
+        if self._operation is None:
+            result = result._from_flat(self._rows, self._columns,
+                                       array("d", result._data))
+        return result
+
+    def _evaluate(self, results):
+        """Compute the expression, looking up and storing nodes in results."""
+        if self._operation is None:
+            return self._operands[0]
+        if self not in results:
+            operands = [operand._evaluate(results)
+                        for operand in self._operands]
+            if self._operation == "*":
+                results[self] = _multiply_chain(operands)
+            else:
+                total = array("d", map(sum, zip(*(m._data
+                                                  for m in operands))))
+                results[self] = operands[0]._from_flat(self._rows,
+                                                       self._columns, total)
+        return results[self]
+
+
+def _as_lazy(operand):
+    """Return operand as a LazyMatrix, or None if it is not a matrix."""
+    if isinstance(operand, LazyMatrix):
+        return operand
+    if isinstance(operand, Matrix):
+        return operand.lazy()
+    return None
+
+
+def _chain_order(dimensions):
+    """Return the optimal split table for a matrix chain.
+
+    dimensions holds the k + 1 sizes of a chain of k matrices. split[i][j]
+    is the position after which the sub-chain i..j is best divided.
+    """
+    count = len(dimensions) - 1
+    cost = [[0] * count for _ in range(count)]
+    split = [[0] * count for _ in range(count)]
+    for length in range(2, count + 1):
+        for i in range(count - length + 1):
+            j = i + length - 1
+            cost[i][j] = None
+            for k in range(i, j):
+                candidate = (cost[i][k] + cost[k + 1][j] + dimensions[i]
+                             * dimensions[k + 1] * dimensions[j + 1])
+                if cost[i][j] is None or candidate < cost[i][j]:
+                    cost[i][j] = candidate
+                    split[i][j] = k
+    return split
+
+
+def _multiply_chain(matrices):
+    """Multiply a chain of matrices in the order with the fewest FLOPs."""
+    dimensions = [matrices[0]._rows] + [m._columns for m in matrices]
+    split = _chain_order(dimensions)
+
+    def product(i, j):
+        if i == j:
+            return matrices[i]
+        k = split[i][j]
+        return product(i, k) * product(k + 1, j)
+
+    return product(0, len(matrices) - 1)
+
+
+def _multiply_rows(names, n, m, p, start, stop):
+    """Compute rows start to stop of a product held in shared memory."""
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    a, b, product = (block.buf.cast("d") for block in blocks)
+    try:
+        product[start * p:stop * p] = _naive_kernel(
+            a[start * m:stop * m], b[:m * p], stop - start, m, p
+        )
+    finally:
+        for view in (a, b, product):
+            view.release()
+        for block in blocks:
+            block.close()
+
+
+def _empty(size):
+    """Return a zero-filled store of size doubles."""
+    return array("d", bytes(size * array("d").itemsize))
+
+
+def _write(data, values):
+    """Write the values produced by an iterator into a store in place.
+
+    Values are copied through a bounded chunk, so no temporary as large as
+    the store is created.
+    """
+    for start in range(0, len(data), _CHUNK_SIZE):
+        chunk = array("d", islice(values, _CHUNK_SIZE))
+        data[start:start + len(chunk)] = chunk
+
+
+def _as_ndarray(data, rows=None, columns=None):
+    """Return a NumPy view of a matrix, or of a store with the given shape."""
+    if rows is None:
+        data, rows, columns = data._data, data._rows, data._columns
+    return numpy.frombuffer(data, dtype=numpy.float64).reshape(rows, columns)
+
+
+def _transpose(data, rows, columns):
+    """Return the columns of a row-major store as a list of lists."""
+    return [list(data[j::columns]) for j in range(columns)]
+
+
+def _naive_kernel(a, b, n, m, p, out=None):
+    """Multiply an n x m store by an m x p store, both row-major.
+
+    The right operand is transposed once so that every dot product walks
+    two contiguous buffers, and the inner loop runs inside sum and map
+    instead of dispatching to __getitem__ per element. The product is
+    written row by row into out if it is given.
+    """
+    b_columns = _transpose(b, m, p)
+    product = _empty(n * p) if out is None else out
+    for i in range(n):
+        a_row = list(a[i * m:(i + 1) * m])
+        product[i * p:(i + 1) * p] = array(
+            "d", [sum(map(mul, a_row, column)) for column in b_columns]
         )
-        for i in range(self._rows):
-            for j in range(other._columns):
-                product[i,j] = sum(
-                    self[i, k] * other[k, j] for k in range(self._columns)
+    return product
+
+
+def _blocked_kernel(a, b, n, m, p, block):
+    """Multiply row-major stores tile by tile.
+
+    Only a block x block tile of the right operand is transposed at a time,
+    so the working set stays small however large the operands are.
+    """
+    product = [0.0] * (n * p)
+    for k0 in range(0, m, block):
+        k1 = min(k0 + block, m)
+        for j0 in range(0, p, block):
+            j1 = min(j0 + block, p)
+            b_columns = [list(b[k0 * p + j:k1 * p:p]) for j in range(j0, j1)]
+            for i in range(n):
+                a_part = list(a[i * m + k0:i * m + k1])
+                start = i * p
+                product[start + j0:start + j1] = map(
+                    add,
+                    product[start + j0:start + j1],
+                    [sum(map(mul, a_part, column)) for column in b_columns],
                 )
-        return product
+    return array("d", product)
+
+
+def _strassen_product(a, b, n, m, p, cutoff):
+    """Multiply row-major stores with Strassen's algorithm.
+
+    The recursion halves all three dimensions at every level and stops as
+    soon as one of them is down to cutoff, so each dimension is only
+    zero-padded to the next multiple of 2^levels. The padding is cut away
+    from the product.
+    """
+    levels = 0
+    dimensions = (n, m, p)
+    while min(dimensions) > cutoff:
+        dimensions = [-(-d // 2) for d in dimensions]
+        levels += 1
+    scale = 1 << levels
+    n_padded, m_padded, p_padded = (-(-d // scale) * scale for d in (n, m, p))
+    padded = _strassen(_pad(a, n, m, n_padded, m_padded),
+                       _pad(b, m, p, m_padded, p_padded),
+                       n_padded, m_padded, p_padded, levels)
+    product = array("d")
+    for i in range(n):
+        product.extend(padded[i * p_padded:i * p_padded + p])
+    return product
+
+
+def _pad(data, rows, columns, padded_rows, padded_columns):
+    """Return a row-major store zero-padded to padded_rows x padded_columns."""
+    padded = []
+    filler = [0.0] * (padded_columns - columns)
+    for i in range(rows):
+        padded.extend(data[i * columns:(i + 1) * columns])
+        padded.extend(filler)
+    padded.extend([0.0] * (padded_columns * (padded_rows - rows)))
+    return padded
+
+
+def _split(data, rows, columns):
+    """Split a row-major store of even dimensions into its four quadrants."""
+    half = columns // 2
+    quadrants = [], [], [], []
+    for i in range(rows):
+        row = i * columns
+        top = 0 if i < rows // 2 else 2
+        quadrants[top].extend(data[row:row + half])
+        quadrants[top + 1].extend(data[row + half:row + columns])
+    return quadrants
+
+
+def _join(c11, c12, c21, c22, rows, columns):
+    """Join four rows x columns quadrants into one row-major store."""
+    data = []
+    for left, right in ((c11, c12), (c21, c22)):
+        for i in range(rows):
+            data.extend(left[i * columns:(i + 1) * columns])
+            data.extend(right[i * columns:(i + 1) * columns])
+    return data
+
+
+def _strassen(a, b, n, m, p, levels):
+    """Multiply n x m and m x p row-major lists with levels of recursion.
+
+    All dimensions must be divisible by 2^levels.
+    """
+    if not levels:
+        return list(_naive_kernel(a, b, n, m, p))
+    a11, a12, a21, a22 = _split(a, n, m)
+    b11, b12, b21, b22 = _split(b, m, p)
+    shape = n // 2, m // 2, p // 2, levels - 1
+
+    def plus(x, y):
+        return list(map(add, x, y))
+
+    def minus(x, y):
+        return list(map(sub, x, y))
+
+    m1 = _strassen(plus(a11, a22), plus(b11, b22), *shape)
+    m2 = _strassen(plus(a21, a22), b11, *shape)
+    m3 = _strassen(a11, minus(b12, b22), *shape)
+    m4 = _strassen(a22, minus(b21, b11), *shape)
+    m5 = _strassen(plus(a11, a12), b22, *shape)
+    m6 = _strassen(minus(a21, a11), plus(b11, b12), *shape)
+    m7 = _strassen(minus(a12, a22), plus(b21, b22), *shape)
+    return _join(
+        plus(minus(plus(m1, m4), m5), m7),
+        plus(m3, m5),
+        plus(m2, m4),
+        plus(plus(minus(m1, m2), m3), m6),
+        n // 2,
+        p // 2,
+    )
 
 
 if __name__ == "__main__":
     matrix0 = Matrix([[1, 2,], [3, 4,]])
     matrix1 = Matrix([[2, 1, 3,], [0, 0, 1,]])
-    print(matrix0 + matrix1)
+    print(matrix0 * matrix1)
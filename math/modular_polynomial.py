@@ -0,0 +1,465 @@
+from functools import lru_cache
+from numbers import Integral
+
+from polynomial import Polynomial, _combine, _karatsuba, _subproduct_tree
+
+
+# Primes of the form c * 2^k + 1 with large k. Products modulo a prime that
+# has no root of unity of the needed order are computed modulo all three
+# and recombined by the Chinese remainder theorem.
+NTT_PRIMES = (998244353, 167772161, 469762049)
+
+# Operand length from which products use the number-theoretic transform,
+# and divisor or quotient length from which division uses Newton iteration.
+NTT_CUTOFF = 64
+DIVISION_CUTOFF = 32
+
+# Number of points up to which multipoint evaluation uses Horner's scheme.
+# Measured, the subproduct tree breaks even at 4096 points modulo an NTT
+# prime and is 1.6 times faster at 8192.
+MULTIPOINT_CUTOFF = 4096
+
+
+class ModularPolynomial(Polynomial):
+    """Represents a polynomial with coefficients in the integers modulo a prime.
+
+    Coefficients are exact integers kept in the range [0, modulus). Takes
+    the same input as Polynomial, except that coefficients must be
+    integers.
+
+    modulus       the prime modulus of the coefficient field
+    """
+
+    def __init__(self, polynomial, variable_name=None, sparse=False, *,
+                 modulus):
+        self.modulus = modulus
+        super().__init__(polynomial, variable_name, sparse)
+
+    @classmethod
+    def parse_many(cls, lines, variable_name=None, sparse=False, *, modulus):
+        """Lazily yields a polynomial for every non-blank line of lines."""
+        for line in lines:
+            if line.strip():
+                yield cls(line, variable_name, sparse, modulus=modulus)
+
+    @staticmethod
+    def _coefficient(text):
+        """Converts a parsed coefficient to an integer."""
+        return int(text)
+
+    def normalize(self):
+        """Reduces the coefficients modulo the modulus and normalizes."""
+        for power, coefficient in self._dict_repr.items():
+            if not isinstance(coefficient, Integral):
+                raise TypeError(f"coefficients must be integers, not "
+                                f"{coefficient.__class__.__name__}")
+            self._dict_repr[power] = coefficient % self.modulus
+        super().normalize()
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}('{self._dict_repr}', "
+                f"modulus={self.modulus})")
+
+    def _new(self, terms, variable, sparse=False):
+        """Creates a polynomial over the same field from a dict of terms."""
+        return self.__class__(terms, variable, sparse, modulus=self.modulus)
+
+    def _coerce(self, other):
+        """Return other as a polynomial and the variable of the result.
+
+        Integers are constant polynomials, polynomials must be over the
+        same field.
+        """
+        if isinstance(other, Integral):
+            return self._new({0: other}, self.variable), self.variable
+        if isinstance(other, Polynomial):
+            if (not isinstance(other, ModularPolynomial)
+                    or other.modulus != self.modulus):
+                raise ValueError("Can't combine polynomials over different "
+                                 "fields.")
+            return super()._coerce(other)
+        return None
+
+    def _convolve(self, a, b):
+        """Returns the product of two coefficient lists modulo the modulus."""
+        return _convolve(a, b, self.modulus)
+
+    def __call__(self, x):
+        """Computes the value of the polynomial at x modulo the modulus."""
+        modulus = self.modulus
+        if self.sparse:
+            terms = self._sparse_terms()
+            result = 0
+            previous = terms[0][0]
+            for power, coefficient in terms:
+                result = (result * pow(x, previous - power, modulus)
+                          + coefficient) % modulus
+                previous = power
+            return result * pow(x, previous, modulus) % modulus
+        result = 0
+        for coefficient in reversed(self._dense()):
+            result = (result * x + coefficient) % modulus
+        return result
+
+    def compile(self):
+        """Returns a function of x evaluating the polynomial modulo the modulus.
+
+        The coefficients are captured once, so a call does no dict lookups.
+        """
+        if self._compiled is None:
+            coefficients = self._dense()[::-1]
+            modulus = self.modulus
+
+            def evaluate(x):
+                result = 0
+                for coefficient in coefficients:
+                    result = (result * x + coefficient) % modulus
+                return result
+
+            self._compiled = evaluate
+        return self._compiled
+
+    def evaluate_many(self, xs):
+        """Computes the values of the polynomial at every point of xs."""
+        return list(map(self.compile(), xs))
+
+    def multipoint_eval(self, points):
+        """Computes the values of the polynomial at every point of points.
+
+        Above MULTIPOINT_CUTOFF points the polynomial is reduced modulo a
+        subproduct tree of the points, which takes quasi-linear time, and
+        subtrees of at most MULTIPOINT_CUTOFF points are evaluated by
+        Horner's scheme.
+        """
+        points = list(points)
+        if len(points) <= MULTIPOINT_CUTOFF:
+            return self.evaluate_many(points)
+        tree = _subproduct_tree(points, self._convolve)
+        return _evaluate_tree(self._dense(), tree, points, self.modulus)
+
+    @classmethod
+    def interpolate(cls, xs, ys, variable_name=None, *, modulus):
+        """Returns the polynomial of least degree through the points (xs, ys).
+
+        Works like Polynomial.interpolate with all arithmetic modulo the
+        modulus, so the xs must be distinct modulo it.
+        """
+        return cls({0: 0}, variable_name, modulus=modulus)._interpolate(
+            [x % modulus for x in xs], ys
+        )
+
+    def _lagrange_sum(self, tree, xs, ys):
+        """Returns the coefficients of the interpolating polynomial.
+
+        The Lagrange denominators are the values of the derivative of the
+        root of tree, evaluated like multipoint_eval.
+        """
+        modulus = self.modulus
+        root = tree[-1][0]
+        derivative = [power * c for power, c in enumerate(root)][1:]
+        if len(xs) <= MULTIPOINT_CUTOFF:
+            denominators = [_horner(derivative, x, modulus) for x in xs]
+        else:
+            denominators = _evaluate_tree(derivative, tree, xs, modulus)
+        weights = [y * pow(d, -1, modulus) % modulus
+                   for y, d in zip(ys, denominators)]
+        return _combine(tree, weights, self._convolve)
+
+    @property
+    def coefficients(self):
+        """Return the dense coefficients as a list of ints, lowest power first.
+
+        Unlike the doubles of Polynomial.coefficients, these are exact for
+        any modulus.
+        """
+        return self._dense()
+
+    def roots(self):
+        """Returns the distinct roots of the polynomial in the field, sorted.
+
+        The product of the distinct linear factors is gcd(f, x^p - x), with
+        x^p found by repeated squaring modulo f. It is split by its gcds
+        with (x + a)^((p - 1) / 2) - 1 for a = 0, 1, ... until only linear
+        factors are left, as in the Cantor-Zassenhaus algorithm.
+        """
+        modulus = self.modulus
+        f = self._dense()
+        while len(f) > 1 and not f[-1]:
+            f.pop()
+        if not f[-1]:
+            raise ValueError("The zero polynomial has infinitely many roots.")
+        if len(f) == 1:
+            return []
+        f = _monic(f, modulus)
+        power = _power_mod([0, 1], modulus, f, modulus) + [0, 0]
+        power[1] = (power[1] - 1) % modulus
+        return sorted(_linear_roots(_gcd(f, power, modulus), modulus))
+
+    def inverse(self, n):
+        """Returns the power series inverse of the polynomial modulo x^n.
+
+        n must be positive and the constant term non-zero. Every Newton
+        step doubles the number of correct coefficients, so the cost is
+        that of a few products of length n.
+        """
+        if n < 1:
+            raise ValueError("n must be a positive integer.")
+        coefficients = self._dense()
+        if not coefficients[0]:
+            raise ValueError("Only a polynomial with a non-zero constant "
+                             "term has an inverse power series.")
+        return self._from_dense(
+            _series_inverse(coefficients, n, self.modulus), self.variable
+        )
+
+    def __divmod__(self, other):
+        """Returns the quotient and remainder of division by other."""
+        coerced = self._coerce(other)
+        if coerced is None:
+            return NotImplemented
+        other, variable = coerced
+        divisor = other._dense()
+        while len(divisor) > 1 and not divisor[-1]:
+            divisor.pop()
+        if not divisor[-1]:
+            raise ZeroDivisionError("polynomial division by zero")
+        quotient, remainder = _divmod(self._dense(), divisor, self.modulus)
+        return (self._from_dense(quotient, variable),
+                self._from_dense(remainder or [0], variable))
+
+    def __floordiv__(self, other):
+        result = self.__divmod__(other)
+        return result if result is NotImplemented else result[0]
+
+    def __mod__(self, other):
+        result = self.__divmod__(other)
+        return result if result is NotImplemented else result[1]
+
+
+def _monic(a, modulus):
+    """Returns a coefficient list divided by its leading coefficient."""
+    inverse = pow(a[-1], -1, modulus)
+    return [c * inverse % modulus for c in a]
+
+
+def _trim(a):
+    """Returns a coefficient list without zero leading coefficients."""
+    size = len(a)
+    while size > 1 and not a[size - 1]:
+        size -= 1
+    return a[:size] or [0]
+
+
+def _gcd(a, b, modulus):
+    """Returns the monic greatest common divisor of two coefficient lists."""
+    a, b = _trim(a), _trim(b)
+    while b[-1]:
+        a, b = b, _trim(_divmod(a, b, modulus)[1])
+    return _monic(a, modulus)
+
+
+def _power_mod(base, exponent, f, modulus):
+    """Returns base^exponent modulo the coefficient list f and modulus."""
+    result = [1]
+    base = _divmod(base, f, modulus)[1]
+    while exponent:
+        if exponent & 1:
+            result = _divmod(_convolve(result, base, modulus), f, modulus)[1]
+        exponent >>= 1
+        if exponent:
+            base = _divmod(_convolve(base, base, modulus), f, modulus)[1]
+    return result
+
+
+def _linear_roots(f, modulus):
+    """Returns the roots of a monic product of distinct linear factors."""
+    if len(f) == 1:
+        return []
+    if len(f) == 2:
+        return [-f[0] % modulus]
+    if modulus == 2:
+        # The only such polynomial of degree 2 over GF(2) is x^2 + x.
+        return [0, 1]
+    for shift in range(modulus):
+        power = _power_mod([shift, 1], (modulus - 1) // 2, f, modulus)
+        power[0] = (power[0] - 1) % modulus
+        factor = _gcd(f, power, modulus)
+        if 1 < len(factor) < len(f):
+            return (_linear_roots(factor, modulus)
+                    + _linear_roots(_divmod(f, factor, modulus)[0], modulus))
+    raise ValueError(f"{modulus} is not a prime.")
+
+
+def _convolve(a, b, modulus):
+    """Returns the product of coefficient lists modulo a prime.
+
+    Long operands are multiplied by a number-theoretic transform, directly
+    modulo the prime if it has a root of unity of the needed order and
+    otherwise modulo the three NTT_PRIMES with Chinese remaindering. When
+    the exact product could exceed what the three primes determine, or is
+    too long for their roots of unity, Karatsuba's method over the integers
+    is used instead.
+    """
+    if min(len(a), len(b)) < NTT_CUTOFF:
+        return [c % modulus for c in _karatsuba(a, b)]
+    length = len(a) + len(b) - 1
+    size = 1
+    while size < length:
+        size *= 2
+    if (modulus - 1) % size == 0:
+        return _ntt_convolve(a, b, modulus, size)[:length]
+    m1, m2, m3 = NTT_PRIMES
+    if (any((prime - 1) % size for prime in NTT_PRIMES)
+            or min(len(a), len(b)) * (modulus - 1) ** 2 >= m1 * m2 * m3):
+        return [c % modulus for c in _karatsuba(a, b)]
+    r1, r2, r3 = (_ntt_convolve(a, b, prime, size) for prime in NTT_PRIMES)
+    m1_inverse = pow(m1, -1, m2)
+    m12_inverse = pow(m1 * m2, -1, m3)
+    m12 = m1 * m2
+    result = []
+    for k in range(length):
+        x = r1[k] + m1 * ((r2[k] - r1[k]) * m1_inverse % m2)
+        x += m12 * ((r3[k] - x) * m12_inverse % m3)
+        result.append(x % modulus)
+    return result
+
+
+@lru_cache(maxsize=None)
+def _root_of_unity(modulus, size):
+    """Returns a primitive root of unity of power-of-two order size."""
+    if (modulus - 1) % size == 0:
+        for base in range(2, modulus):
+            root = pow(base, (modulus - 1) // size, modulus)
+            if (pow(root, size, modulus) == 1
+                    and (size == 1 or pow(root, size // 2, modulus) != 1)):
+                return root
+    raise ValueError(f"{modulus} has no root of unity of order {size}.")
+
+
+def _ntt_convolve(a, b, modulus, size):
+    """Returns the cyclic convolution of length size of a and b modulo modulus."""
+    root = _root_of_unity(modulus, size)
+    a_image = _ntt([c % modulus for c in a] + [0] * (size - len(a)),
+                   root, modulus)
+    b_image = _ntt([c % modulus for c in b] + [0] * (size - len(b)),
+                   root, modulus)
+    product = _ntt([x * y % modulus for x, y in zip(a_image, b_image)],
+                   pow(root, -1, modulus), modulus)
+    size_inverse = pow(size, -1, modulus)
+    return [c * size_inverse % modulus for c in product]
+
+
+def _ntt(values, root, modulus):
+    """Returns the number-theoretic transform of values.
+
+    root is a primitive root of unity of order len(values) modulo modulus.
+    This is the Stockham formulation: every stage reads one buffer and
+    writes the other, so no bit-reversal pass is needed.
+    """
+    x = list(values)
+    n = len(x)
+    y = [0] * n
+    m, s = n, 1
+    while m > 1:
+        half = m // 2
+        step = pow(root, n // m, modulus)
+        twiddles = [1] * half
+        for p in range(1, half):
+            twiddles[p] = twiddles[p - 1] * step % modulus
+        if s >= half:
+            for p, w in enumerate(twiddles):
+                a = x[s * p:s * (p + 1)]
+                b = x[s * (p + half):s * (p + half + 1)]
+                y[2 * s * p:s * (2 * p + 1)] = [(u + v) % modulus
+                                                for u, v in zip(a, b)]
+                y[s * (2 * p + 1):2 * s * (p + 1)] = [(u - v) * w % modulus
+                                                      for u, v in zip(a, b)]
+        else:
+            for q in range(s):
+                a = x[q:q + s * half:s]
+                b = x[q + s * half::s]
+                y[q::2 * s] = [(u + v) % modulus for u, v in zip(a, b)]
+                y[q + s::2 * s] = [(u - v) * w % modulus
+                                   for u, v, w in zip(a, b, twiddles)]
+        x, y = y, x
+        m, s = half, s * 2
+    return x
+
+
+def _series_inverse(f, size, modulus):
+    """Returns the first size coefficients of 1 / f modulo modulus."""
+    inverse = [pow(f[0], -1, modulus)]
+    length = 1
+    while length < size:
+        length = min(2 * length, size)
+        error = [-c % modulus
+                 for c in _convolve(f[:length], inverse, modulus)[:length]]
+        error[0] = (error[0] + 2) % modulus
+        inverse = _convolve(inverse, error, modulus)[:length]
+    return inverse
+
+
+def _evaluate_tree(coefficients, tree, points, modulus):
+    """Evaluates coefficients at points by remainders down the tree."""
+    values = []
+
+    def descend(remainder, depth, index):
+        # The node covers the points from index * 2^depth onwards.
+        start = index << depth
+        stop = min(start + (1 << depth), len(points))
+        if stop - start <= MULTIPOINT_CUTOFF:
+            values.extend(_horner(remainder, x, modulus)
+                          for x in points[start:stop])
+            return
+        for child in (2 * index, 2 * index + 1):
+            if child < len(tree[depth - 1]):
+                descend(_divmod(remainder, tree[depth - 1][child], modulus)[1],
+                        depth - 1, child)
+
+    depth = len(tree) - 1
+    descend(_divmod(coefficients, tree[depth][0], modulus)[1], depth, 0)
+    return values
+
+
+def _horner(coefficients, x, modulus):
+    """Evaluates coefficients, lowest power first, at x modulo modulus."""
+    result = 0
+    for coefficient in reversed(coefficients):
+        result = (result * x + coefficient) % modulus
+    return result
+
+
+def _divmod(a, b, modulus):
+    """Returns the quotient and remainder of coefficient lists modulo modulus.
+
+    b must have a non-zero leading coefficient.
+    """
+    n, m = len(a), len(b)
+    if n < m:
+        return [0], list(a)
+    if m <= DIVISION_CUTOFF or n - m <= DIVISION_CUTOFF:
+        remainder = list(a)
+        quotient = [0] * (n - m + 1)
+        lead_inverse = pow(b[-1], -1, modulus)
+        for i in range(n - m, -1, -1):
+            coefficient = remainder[i + m - 1] * lead_inverse % modulus
+            quotient[i] = coefficient
+            if coefficient:
+                remainder[i:i + m] = [(r - coefficient * d) % modulus
+                                      for r, d in zip(remainder[i:i + m], b)]
+        return quotient, remainder[:m - 1]
+    size = n - m + 1
+    inverse = _series_inverse(b[::-1], size, modulus)
+    quotient = _convolve(a[::-1][:size], inverse, modulus)[:size][::-1]
+    product = _convolve(quotient, b, modulus)
+    remainder = [(x - y) % modulus for x, y in zip(a[:m - 1], product)]
+    return quotient, remainder
+
+
+if __name__ == "__main__":
+    poly = ModularPolynomial("3*x^2 + 4*x + 5", modulus=7)
+    print("polynomial: ", poly)
+    print("square: ", poly * poly)
+    print("divmod: ", divmod(poly * poly + 1, poly))
+    print("inverse mod x^4: ", poly.inverse(4))
+    print("value at 2: ", poly(2))
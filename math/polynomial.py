@@ -1,4 +1,38 @@
+from array import array
+import cmath
+from concurrent.futures import ProcessPoolExecutor
+from decimal import MAX_EMAX, MAX_PREC, Decimal, localcontext
+from fractions import Fraction
+from functools import lru_cache
+from itertools import repeat
+import math
+from numbers import Integral, Number
 import re
+import sys
+
+try:
+    import numpy
+except ImportError:     # evaluate_many falls back to array-based Horner
+    numpy = None
+
+
+# Operand lengths from which multiplication switches from the schoolbook
+# method to Karatsuba, or to Kronecker substitution for integer
+# coefficients, and for float coefficients from Karatsuba to the FFT,
+# which is done in fixed point without NumPy.
+KARATSUBA_CUTOFF = 32
+FFT_CUTOFF = 64 if numpy is not None else 128
+
+# Bits kept of the largest coefficient of a fixed-point product.
+FIXED_POINT_BITS = 53
+
+# Coefficient bits up to which Kronecker substitution packs decimal
+# digits, below the default limit of int to str conversions.
+DECIMAL_SLOT_BITS = 12000
+
+# Number of distinct polynomial strings whose parse results are kept.
+PARSE_CACHE_SIZE = 4096
+
 
 class Polynomial:
     """Represents a polynomial.
@@ -10,52 +44,98 @@ class Polynomial:
     polynomial    a string representing a polynomial 
                   in standard algebraic notation
                   (e.g. '2*x^2 + 3*x - 2')
+    sparse        if true only the non-zero terms are stored, so memory
+                  and evaluation cost depend on the number of terms
+                  rather than on the degree
     """
 
     pattern = (r"\s*(?P<sign>[-+]?)\s*(?P<coefficient>\d*\.?\d*)\s*"
                r"\*?\s*(?P<variable>[a-z]?)\s*(\^\s*(?P<power>(-[1-9])?[1-9]*\d*))?")
     regex = re.compile(pattern)
 
-    def __init__(self, polynomial, variable_name=None):
+    def __init__(self, polynomial, variable_name=None, sparse=False):
+        self.sparse = sparse
         if isinstance(polynomial, str):
-            self.variable = variable_name
-            self._dict_repr = {}
-        
-            matches = self.regex.finditer(polynomial)
-            for match in matches:
-                member = match.groupdict()
-                if member["power"] is None:
-                    member["power"] = ""
-                
-                if self.variable is None and member["variable"]:
-                    self.variable = member["variable"]
-                
-                if not member["sign"] + member["coefficient"] + member["power"]:
-                    continue
-            
-                member["coefficient"] = member["coefficient"] if member["coefficient"] else 1
-                if not member["power"]:
-                    if member["variable"]:
-                        member["power"] = 1
-                    else:
-                        member["power"] = 0
-        
-                self._dict_repr[int(member["power"])] = float(
-                    f"{member['sign']}{member['coefficient']}"
-                )
-                
+            terms, self.variable = _parse(" ".join(polynomial.split()),
+                                          variable_name)
+            self._dict_repr = {power: self._coefficient(coefficient)
+                               for power, coefficient in terms}
+
         elif isinstance(polynomial, dict):
             self._dict_repr = polynomial
             self.variable = "x" if variable_name is None else variable_name
 
         self.normalize()
 
+    @classmethod
+    def parse_many(cls, lines, variable_name=None, sparse=False):
+        """Lazily yields a polynomial for every non-blank line of lines.
+
+        lines is any iterable of strings, an open text file for example.
+        Parse results are cached, so repeated strings are parsed once.
+        """
+        for line in lines:
+            if line.strip():
+                yield cls(line, variable_name, sparse)
+
+    @staticmethod
+    def parse_cache_info():
+        """Returns the hits, misses, maxsize and currsize of the parse cache."""
+        return _parse.cache_info()
+
+    @staticmethod
+    def parse_cache_clear():
+        """Empties the parse cache and resets its statistics."""
+        _parse.cache_clear()
+
     def normalize(self):
-        """If some power is missed inserts this power in a dict with a value of 0."""
+        """If some power is missed inserts this power in a dict with a value of 0.
+
+        A sparse polynomial drops its zero terms instead.
+        """
+
+        if self.sparse:
+            for power in [p for p, c in self._dict_repr.items() if not c]:
+                del self._dict_repr[power]
+            if not self._dict_repr:
+                self._dict_repr[0] = 0
+            self.power = max(self._dict_repr.keys())
+        else:
+            self.power = max(self._dict_repr.keys())
+            for power in range(self.power + 1):
+                self._dict_repr.setdefault(power, 0)
+        self._coefficients = None
+        self._compiled = None
+        self._derivatives = {0: self}
 
-        self.power = max(self._dict_repr.keys())
-        for power in range(self.power + 1):
-            self._dict_repr.setdefault(power, 0)
+    def __getstate__(self):
+        """Pickles the polynomial without its cached evaluators."""
+        state = self.__dict__.copy()
+        for cache in ("_coefficients", "_compiled", "_derivatives"):
+            del state[cache]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._coefficients = None
+        self._compiled = None
+        self._derivatives = {0: self}
+
+    def __getitem__(self, power):
+        """Return the coefficient of the term with the given power."""
+        return self._dict_repr.get(power, 0)
+
+    def __setitem__(self, power, coefficient):
+        """Set the coefficient of the term with the given power."""
+        self._dict_repr[power] = coefficient
+        self.normalize()
+
+    @property
+    def coefficients(self):
+        """Return the dense coefficients as an array, lowest power first."""
+        if self._coefficients is None:
+            self._coefficients = array("d", self._dense())
+        return self._coefficients
 
     def __str__(self):
         """Transforms dict_ into a polynomial string representation."""
@@ -100,10 +180,111 @@ class Polynomial:
                            in self._dict_repr.items() if power != 0}
         if -1 in derivative_dict:
             del derivative_dict[-1]
-        return self.__class__(derivative_dict, self.variable)
+        if not derivative_dict:
+            derivative_dict[0] = 0
+        return self._new(derivative_dict, self.variable, self.sparse)
+
+    def derivative(self, n=1):
+        """Returns the n-th derivative of the polynomial.
+
+        Derivatives are computed on demand and cached, every one from the
+        previous one, until the polynomial is changed. n must be a
+        non-negative integer.
+        """
+        if not isinstance(n, Integral) or n < 0:
+            raise ValueError("n must be a non-negative integer.")
+        known = n
+        while known not in self._derivatives:
+            known -= 1
+        for order in range(known, n):
+            self._derivatives[order + 1] = (
+                self._derivatives[order].get_derivative()
+            )
+        return self._derivatives[n]
+
+    def roots(self, tolerance=1e-12, max_iterations=500):
+        """Finds all complex roots of the polynomial, with multiplicity.
+
+        All roots are approximated simultaneously by the Aberth method,
+        starting from a circle that encloses them, and each one is then
+        polished by a few Newton steps. Roots are returned as complex
+        numbers.
+        """
+        coefficients = self._dense()
+        degree = len(coefficients) - 1
+        while degree > 0 and not coefficients[degree]:
+            degree -= 1
+        zeros = 0
+        while zeros < degree and not coefficients[zeros]:
+            zeros += 1
+        if degree == 0:
+            if not coefficients[0]:
+                raise ValueError("The zero polynomial has infinitely many roots.")
+            return []
+        if zeros == degree:
+            return [0j] * zeros
+        polynomial = self
+        if zeros or degree < self.power:
+            # Roots at zero are split off and leading zeros dropped.
+            polynomial = self._new(
+                dict(enumerate(coefficients[zeros:degree + 1])), self.variable
+            )
+        value = polynomial.compile()
+        slope = polynomial.derivative().compile()
+        count = degree - zeros
+        lead = coefficients[degree]
+        radius = 1 + max(abs(c / lead) for c in coefficients[zeros:degree])
+        estimates = [radius * cmath.exp(2j * cmath.pi * (k + 0.25) / count)
+                     for k in range(count)]
+        for _ in range(max_iterations):
+            largest = 0
+            for k, z in enumerate(estimates):
+                derivative = slope(z)
+                if not derivative:
+                    continue
+                ratio = value(z) / derivative
+                repulsion = sum(1 / (z - w) for j, w in enumerate(estimates)
+                                if j != k and z != w)
+                step = ratio / (1 - ratio * repulsion)
+                estimates[k] = z - step
+                largest = max(largest, abs(step) / max(abs(z), 1))
+            if largest < tolerance:
+                break
+        for k, z in enumerate(estimates):
+            for _ in range(3):
+                derivative = slope(z)
+                if not derivative:
+                    break
+                z -= value(z) / derivative
+            estimates[k] = z
+        return [0j] * zeros + estimates
+
+    @staticmethod
+    def roots_many(polynomials, workers=None, **options):
+        """Finds the roots of many polynomials in a pool of processes.
+
+        Returns a list holding the roots() of every polynomial, in order.
+        options are passed on to roots().
+        """
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_roots, polynomials, repeat(options)))
+
+    def _sparse_terms(self):
+        """Return the terms as (power, coefficient) pairs, highest power first."""
+        return sorted(self._dict_repr.items(), reverse=True)
 
     def __call__(self, x):
         """Computes the value of the polynomial at x."""
+        if self.sparse:
+            # Horner's scheme over the stored terms only: the gap between
+            # neighbouring powers is bridged by a single exponentiation.
+            terms = self._sparse_terms()
+            result = 0
+            previous = terms[0][0]
+            for power, coefficient in terms:
+                result = result * x ** (previous - power) + coefficient
+                previous = power
+            return result * x ** previous
         result = 0
         power = self.power
         while power > 0:
@@ -112,8 +293,538 @@ class Polynomial:
         result = result + self._dict_repr[0]
         return result
 
-        
-        
+    def compile(self):
+        """Returns a function of x specialized to evaluate the polynomial.
+
+        The function is generated Horner code with the coefficients inlined
+        as constants, so a call does no dict lookups and runs no loop. It
+        is cached until the polynomial is changed.
+        """
+        if self._compiled is None:
+            constants = {}
+
+            def constant(value):
+                # Infinite and NaN floats have no literal, and neither do
+                # ints beyond the limit of int to str conversions.
+                if (isinstance(value, int) or isinstance(value, float)
+                        and math.isfinite(value)):
+                    try:
+                        return repr(value)
+                    except ValueError:
+                        pass
+                name = f"c{len(constants)}"
+                constants[name] = value
+                return name
+
+            if self.sparse:
+                terms = self._sparse_terms() + [(0, 0)]
+                lines = [f"    result = {constant(terms[0][1])}"]
+                for (previous, _), (power, coefficient) in zip(terms, terms[1:]):
+                    step = "result * x"
+                    if previous - power > 1:
+                        step += f" ** {previous - power}"
+                    if coefficient:
+                        step += f" + {constant(coefficient)}"
+                    if previous != power:
+                        lines.append(f"    result = {step}")
+            else:
+                coefficients = self._dense()
+                lines = [f"    result = {constant(coefficients[-1])}"]
+                for coefficient in coefficients[-2::-1]:
+                    if coefficient:
+                        lines.append(f"    result = result * x + "
+                                     f"{constant(coefficient)}")
+                    else:
+                        lines.append("    result = result * x")
+            lines.append("    return result")
+            source = "def evaluate(x):\n" + "\n".join(lines) + "\n"
+            exec(source, constants)
+            self._compiled = constants["evaluate"]
+        return self._compiled
+
+    def evaluate_many(self, xs):
+        """Computes the values of the polynomial at every point of xs.
+
+        All points go through one Horner pass per coefficient. The values
+        are returned as a NumPy array if NumPy is available and as
+        an array of doubles otherwise.
+        """
+        if self.sparse:
+            return self._evaluate_many_sparse(xs)
+        coefficients = self.coefficients
+        if numpy is not None:
+            xs = numpy.asarray(xs, dtype=numpy.float64)
+            result = numpy.full(xs.shape, coefficients[-1])
+            for coefficient in coefficients[-2::-1]:
+                result *= xs
+                result += coefficient
+            return result
+        xs = array("d", xs)
+        result = array("d", [coefficients[-1]]) * len(xs)
+        for coefficient in coefficients[-2::-1]:
+            result = array("d", [value * x + coefficient
+                                 for value, x in zip(result, xs)])
+        return result
+
+    def _evaluate_many_sparse(self, xs):
+        """Computes the values of a sparse polynomial at every point of xs."""
+        terms = self._sparse_terms()
+        if numpy is not None:
+            xs = numpy.asarray(xs, dtype=numpy.float64)
+            result = numpy.zeros(xs.shape)
+        else:
+            xs = array("d", xs)
+            result = array("d", [0.0]) * len(xs)
+        previous = terms[0][0]
+        for power, coefficient in terms + [(0, 0)]:
+            gap = previous - power
+            if numpy is not None:
+                result *= xs ** gap
+                result += coefficient
+            else:
+                result = array("d", [value * x ** gap + coefficient
+                                     for value, x in zip(result, xs)])
+            previous = power
+        return result
+
+    @staticmethod
+    def _coefficient(text):
+        """Converts a parsed coefficient to a number."""
+        return float(text)
+
+    def _new(self, terms, variable, sparse=False):
+        """Creates a polynomial of the same kind from a dict of terms."""
+        return self.__class__(terms, variable, sparse)
+
+    @staticmethod
+    def _convolve(a, b):
+        """Returns the product of two coefficient lists."""
+        return _multiply(a, b)
+
+    def _dense(self):
+        """Return the coefficients as a list, lowest power first."""
+        return [self._dict_repr.get(power, 0) for power in range(self.power + 1)]
+
+    def _from_dense(self, coefficients, variable):
+        """Create a polynomial from a list of coefficients, lowest power first."""
+        size = len(coefficients)
+        while size > 1 and not coefficients[size - 1]:
+            size -= 1
+        return self._new(dict(enumerate(coefficients[:size])), variable)
+
+    def _coerce(self, other):
+        """Return other as a polynomial and the variable of the result.
+
+        Returns None if other is neither a polynomial nor a number.
+        """
+        if isinstance(other, Number):
+            return self._new({0: other}, self.variable), self.variable
+        if not isinstance(other, Polynomial):
+            return None
+        if not isinstance(self, type(other)):
+            # Polynomials of a more specific kind, such as those over a
+            # finite field, decide themselves what they combine with.
+            return None
+        if (self.variable is not None and other.variable is not None
+                and self.variable != other.variable
+                and self.power and other.power):
+            raise ValueError("Can't combine polynomials in different "
+                             "variables.")
+        if self.power or other.variable is None:
+            return other, self.variable
+        return other, other.variable
+
+    def __neg__(self):
+        if self.sparse:
+            return self._new(
+                {power: -c for power, c in self._dict_repr.items()},
+                self.variable, sparse=True
+            )
+        return self._from_dense([-c for c in self._dense()], self.variable)
+
+    def __add__(self, other):
+        """Returns the sum of the polynomial and a polynomial or a number."""
+        coerced = self._coerce(other)
+        if coerced is None:
+            return NotImplemented
+        other, variable = coerced
+        if self.sparse or other.sparse:
+            terms = dict(self._dict_repr)
+            for power, coefficient in other._dict_repr.items():
+                terms[power] = terms.get(power, 0) + coefficient
+            return self._new(terms, variable, sparse=True)
+        return self._from_dense(_add_lists(self._dense(), other._dense()),
+                                variable)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """Returns the difference of the polynomial and other."""
+        coerced = self._coerce(other)
+        if coerced is None:
+            return NotImplemented
+        return self + -coerced[0]
+
+    def __rsub__(self, other):
+        coerced = self._coerce(other)
+        if coerced is None:
+            return NotImplemented
+        return coerced[0] + -self
+
+    def __mul__(self, other):
+        """Returns the product of the polynomial and a polynomial or a number.
+
+        Depending on the degrees the coefficients are convolved by the
+        schoolbook method, Karatsuba's method or an FFT. If either operand
+        is sparse, the product is sparse and computed term by term.
+        """
+        coerced = self._coerce(other)
+        if coerced is None:
+            return NotImplemented
+        other, variable = coerced
+        if self.sparse or other.sparse:
+            terms = {}
+            for power0, coefficient0 in self._dict_repr.items():
+                if not coefficient0:
+                    continue
+                for power1, coefficient1 in other._dict_repr.items():
+                    power = power0 + power1
+                    terms[power] = (terms.get(power, 0)
+                                    + coefficient0 * coefficient1)
+            return self._new(terms, variable, sparse=True)
+        return self._from_dense(self._convolve(self._dense(), other._dense()),
+                                variable)
+
+    __rmul__ = __mul__
+
+    def multipoint_eval(self, points):
+        """Computes the values of the polynomial at every point of points.
+
+        Every point is evaluated by Horner's scheme, exactly for exact
+        coefficients and points. Reducing modulo a subproduct tree of the
+        points loses accuracy fast in floating point, and over the integers
+        or fractions its coefficients grow so large that it is slower than
+        Horner's scheme at any size; ModularPolynomial uses it.
+        """
+        return list(map(self.compile(), points))
+
+    @classmethod
+    def interpolate(cls, xs, ys, variable_name=None):
+        """Returns the polynomial of least degree through the points (xs, ys).
+
+        The Lagrange weights divide every y by the product of the
+        differences of its x to the other points, and the result is
+        assembled bottom-up along the subproduct tree of the points.
+        Integer inputs give Fraction coefficients; their sums are kept as
+        integers over one common denominator per node of the tree, so all
+        products are of integers.
+        """
+        return cls({0: 0}, variable_name)._interpolate(xs, ys)
+
+    def _interpolate(self, xs, ys):
+        """Interpolates in the coefficient arithmetic of the polynomial."""
+        xs, ys = list(xs), list(ys)
+        if len(xs) != len(ys) or not xs:
+            raise ValueError("Interpolation needs equally many xs and ys.")
+        if len(set(xs)) != len(xs):
+            raise ValueError("Interpolation points must be distinct.")
+        tree = _subproduct_tree(xs, self._convolve)
+        return self._from_dense(self._lagrange_sum(tree, xs, ys),
+                                self.variable)
+
+    @staticmethod
+    def _lagrange_sum(tree, xs, ys):
+        """Returns the coefficients of the interpolating polynomial.
+
+        tree is the subproduct tree of xs.
+        """
+        denominators = [_product(x - other for other in xs if other != x)
+                        for x in xs]
+        if all(isinstance(value, int) for value in xs + ys):
+            return _combine_fractions(tree, ys, denominators)
+        weights = [_divide(y, d) for y, d in zip(ys, denominators)]
+        return _combine(tree, weights, _multiply)
+
+
+def _combine(tree, weights, multiply):
+    """Returns the sum of weights[i] times the product of the other leaves.
+
+    The sums are assembled bottom-up along the subproduct tree, multiplying
+    the sum of either child by the product of the other one. multiply is
+    the product of two coefficient lists.
+    """
+    level = [[weight] for weight in weights]
+    for nodes in tree[:-1]:
+        combined = []
+        for i in range(0, len(level) - 1, 2):
+            combined.append(_add_lists(multiply(level[i], nodes[i + 1]),
+                                       multiply(level[i + 1], nodes[i])))
+        if len(level) % 2:
+            combined.append(level[-1])
+        level = combined
+    return level[0]
+
+
+def _combine_fractions(tree, numerators, denominators):
+    """Works like _combine for the weights numerators[i] / denominators[i].
+
+    tree, numerators and denominators are integers. Every sum is kept as
+    integer coefficients over a common denominator, reduced by their
+    greatest common divisor, and only the result is made of Fractions.
+    """
+    level = [([n], d) for n, d in zip(numerators, denominators)]
+    for nodes in tree[:-1]:
+        combined = []
+        for i in range(0, len(level) - 1, 2):
+            (left, a), (right, b) = level[i], level[i + 1]
+            common = a // math.gcd(a, b) * b
+            terms = _add_lists(
+                _multiply([c * (common // a) for c in left], nodes[i + 1]),
+                _multiply([c * (common // b) for c in right], nodes[i])
+            )
+            divisor = math.gcd(common, *terms)
+            combined.append(([c // divisor for c in terms],
+                             common // divisor))
+        if len(level) % 2:
+            combined.append(level[-1])
+        level = combined
+    coefficients, denominator = level[0]
+    return [Fraction(c, denominator) for c in coefficients]
+
+
+def _divide(a, b):
+    """Divides a by b, exactly if both are integers."""
+    if isinstance(a, Integral) and isinstance(b, Integral):
+        return Fraction(a, b)
+    return a / b
+
+
+def _product(values):
+    """Returns the product of values."""
+    result = 1
+    for value in values:
+        result *= value
+    return result
+
+
+def _subproduct_tree(points, multiply):
+    """Returns the levels of the subproduct tree of points.
+
+    The first level holds x - point for every point, every next level the
+    products of neighbouring pairs of the previous one (an odd last node is
+    carried up unchanged) and the last level the product of all of them.
+    multiply is the product of two coefficient lists.
+    """
+    level = [[-point, 1] for point in points]
+    tree = [level]
+    while len(level) > 1:
+        paired = [multiply(level[i], level[i + 1])
+                  for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+        tree.append(level)
+    return tree
+
+
+def _roots(polynomial, options):
+    """Returns the roots of polynomial, for use in a worker process."""
+    return polynomial.roots(**options)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse(polynomial, variable_name):
+    """Parses a polynomial string with whitespace runs collapsed.
+
+    Returns the variable and a tuple of (power, coefficient) pairs with the
+    coefficients as text, so that the cached result can't be mutated.
+    """
+    variable = variable_name
+    terms = {}
+    for match in Polynomial.regex.finditer(polynomial):
+        member = match.groupdict()
+        if member["power"] is None:
+            member["power"] = ""
+
+        if variable is None and member["variable"]:
+            variable = member["variable"]
+
+        if not (member["sign"] + member["coefficient"] + member["variable"]
+                + member["power"]):
+            continue
+
+        member["coefficient"] = member["coefficient"] if member["coefficient"] else 1
+        if not member["power"]:
+            if member["variable"]:
+                member["power"] = 1
+            else:
+                member["power"] = 0
+
+        terms[int(member["power"])] = f"{member['sign']}{member['coefficient']}"
+    return tuple(terms.items()), variable
+
+
+def _multiply(a, b):
+    """Returns the convolution of two coefficient lists.
+
+    Integer coefficients are convolved exactly by Kronecker substitution
+    and real float coefficients through the FFT, or in fixed point without
+    NumPy. Other coefficients, such as Fraction or complex ones, and short
+    operands are convolved by Karatsuba's or the schoolbook method.
+    """
+    shortest = min(len(a), len(b))
+    if shortest < KARATSUBA_CUTOFF:
+        return _schoolbook(a, b)
+    coefficients = a + b
+    if all(isinstance(c, int) for c in coefficients):
+        return _kronecker_multiply(a, b)
+    if shortest < FFT_CUTOFF or not all(isinstance(c, (int, float))
+                                        for c in coefficients):
+        return _karatsuba(a, b)
+    if numpy is None:
+        return _fixed_point_multiply(a, b)
+    return _fft_multiply(a, b)
+
+
+def _schoolbook(a, b):
+    """Convolves two coefficient lists term by term."""
+    if len(a) < len(b):
+        a, b = b, a
+    result = [0] * (len(a) + len(b) - 1)
+    for j, coefficient in enumerate(b):
+        if coefficient:
+            result[j:j + len(a)] = [r + coefficient * c
+                                    for r, c in zip(result[j:j + len(a)], a)]
+    return result
+
+
+def _karatsuba(a, b):
+    """Convolves two coefficient lists by Karatsuba's method.
+
+    The operands are split at half the length of the longer one, so that
+    three half-size products replace the four of the schoolbook method.
+    """
+    if min(len(a), len(b)) < KARATSUBA_CUTOFF:
+        return _schoolbook(a, b)
+    half = max(len(a), len(b)) // 2
+    a_low, a_high = a[:half], a[half:]
+    b_low, b_high = b[:half], b[half:]
+    low = _karatsuba(a_low, b_low)
+    if not a_high or not b_high:
+        # One operand fits in the low half, so there is no high product.
+        high = []
+        if b_high:
+            middle = _karatsuba(a_low, b_high)
+        else:
+            middle = _karatsuba(a_high, b_low)
+    else:
+        high = _karatsuba(a_high, b_high)
+        both = _karatsuba(_add_lists(a_low, a_high), _add_lists(b_low, b_high))
+        middle = _add_lists(both, [-c for c in _add_lists(low, high)])
+    result = [0] * (len(a) + len(b) - 1)
+    for shift, part in ((0, low), (half, middle), (2 * half, high)):
+        result[shift:shift + len(part)] = _add_lists(
+            result[shift:shift + len(part)], part
+        )
+    return result
+
+
+def _add_lists(a, b):
+    """Adds two coefficient lists of possibly different lengths."""
+    if len(a) < len(b):
+        a, b = b, a
+    return [x + y for x, y in zip(a, b)] + a[len(b):]
+
+
+def _fft_multiply(a, b):
+    """Convolves two lists of real float coefficients through the FFT."""
+    length = len(a) + len(b) - 1
+    size = 1
+    while size < length:
+        size *= 2
+    product = numpy.fft.irfft(
+        numpy.fft.rfft(a, size) * numpy.fft.rfft(b, size), size
+    )
+    return product[:length].tolist()
+
+
+def _fixed_point_multiply(a, b):
+    """Convolves two lists of real float coefficients without NumPy.
+
+    Every operand is scaled by a power of two that gives its largest
+    coefficient FIXED_POINT_BITS bits, rounded to integers and convolved
+    by Kronecker substitution; the error is that of the rounding, which is
+    smaller than the one of an FFT. Infinite, NaN or huge coefficients are
+    convolved by Karatsuba's method instead.
+    """
+    largest = [max(map(abs, values)) for values in (a, b)]
+    if not all(math.isfinite(c) for c in largest) or (
+            math.frexp(largest[0])[1] + math.frexp(largest[1])[1]
+            + min(len(a), len(b)).bit_length() >= sys.float_info.max_exp):
+        return _karatsuba(a, b)
+    shifts = [FIXED_POINT_BITS - math.frexp(c)[1] for c in largest]
+    product = _kronecker_multiply(
+        [round(math.ldexp(c, shifts[0])) for c in a],
+        [round(math.ldexp(c, shifts[1])) for c in b],
+    )
+    shift = -shifts[0] - shifts[1]
+    return [math.ldexp(c, shift) for c in product]
+
+
+def _kronecker_multiply(a, b):
+    """Convolves two lists of integer coefficients by Kronecker substitution.
+
+    Both lists are packed into one number each with a slot per coefficient,
+    wide enough for every coefficient of the product, and the product of
+    the two numbers is unpacked again. Adding the coefficient bound to
+    every slot of the product makes all of them non-negative, so they are
+    read back without borrows. Slots of up to DECIMAL_SLOT_BITS bits are
+    decimal digits, multiplied by the decimal module, which uses a
+    number-theoretic transform for long operands; wider ones are bytes of
+    Python integers, which need no conversion to decimal.
+    """
+    length = len(a) + len(b) - 1
+    bound = max(map(abs, a)) * max(map(abs, b)) * min(len(a), len(b))
+    if not bound:
+        return [0] * length
+    if bound.bit_length() < DECIMAL_SLOT_BITS:
+        width = len(str(2 * bound))
+        with localcontext() as context:
+            context.prec = MAX_PREC
+            context.Emax = MAX_EMAX
+            product = _pack_decimal(a, width) * _pack_decimal(b, width)
+            product += Decimal(("%0*d" % (width, bound)) * length)
+            digits = str(product).zfill(width * length)
+        return [int(digits[i - width:i]) - bound
+                for i in range(len(digits), 0, -width)]
+    size = (2 * bound).bit_length() // 8 + 1
+    product = _pack_bytes(a, size) * _pack_bytes(b, size)
+    product += int.from_bytes(bound.to_bytes(size, "little") * length,
+                              "little")
+    data = product.to_bytes(size * length, "little")
+    return [int.from_bytes(data[i:i + size], "little") - bound
+            for i in range(0, len(data), size)]
+
+
+def _pack_decimal(coefficients, width):
+    """Returns integer coefficients as a decimal of width-digit slots."""
+    zeros = "0" * width
+    positive = "".join("%0*d" % (width, c) if c > 0 else zeros
+                       for c in reversed(coefficients))
+    negative = "".join("%0*d" % (width, -c) if c < 0 else zeros
+                       for c in reversed(coefficients))
+    return Decimal(positive) - Decimal(negative)
+
+
+def _pack_bytes(coefficients, size):
+    """Returns integer coefficients as an integer of size-byte slots."""
+    zeros = bytes(size)
+    positive = b"".join(c.to_bytes(size, "little") if c > 0 else zeros
+                        for c in coefficients)
+    negative = b"".join((-c).to_bytes(size, "little") if c < 0 else zeros
+                        for c in coefficients)
+    return (int.from_bytes(positive, "little")
+            - int.from_bytes(negative, "little"))
 
 
 if __name__ == "__main__":
@@ -126,3 +837,6 @@ if __name__ == "__main__":
     poly = Polynomial("x^2 + x + 1")
     print(poly(0))
     print(poly(1))
+    print(poly.evaluate_many(range(5)))
+    print("interpolated: ",
+          Polynomial.interpolate([0, 1, 2], poly.evaluate_many([0, 1, 2])))
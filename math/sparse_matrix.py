@@ -0,0 +1,223 @@
+from array import array
+from bisect import bisect_left
+
+from matrix import Matrix
+
+
+class SparseMatrix:
+    """A matrix that stores only its non-zero elements.
+
+    Elements are kept in compressed sparse row (CSR) form: the column
+    indices and values of row i occupy positions indptr[i] to indptr[i + 1]
+    of the indices and values arrays, sorted by column. Coordinate (COO)
+    triples are the building format, see from_coo().
+    """
+
+    def __init__(self, data_set):
+        """Create a sparse matrix from a list of rows like Matrix does."""
+        rows = len(data_set)
+        columns = len(data_set[0])
+        entries = []
+        for i, row in enumerate(data_set):
+            if len(row) != columns:
+                raise ValueError("All rows of a matrix must have equal length.")
+            entries.extend((i, j, value) for j, value in enumerate(row) if value)
+        self._build(rows, columns, entries)
+
+    def _build(self, rows, columns, entries):
+        """Fill the CSR arrays from (row, column, value) triples.
+
+        Duplicate coordinates are summed and resulting zeros are dropped.
+        """
+        merged = {}
+        for i, j, value in entries:
+            if not (0 <= i < rows and 0 <= j < columns):
+                raise IndexError(f"{self.__class__.__name__} index out of range")
+            merged[i, j] = merged.get((i, j), 0.0) + value
+        self._rows = rows
+        self._columns = columns
+        self._indptr = array("q", [0] * (rows + 1))
+        self._indices = array("q")
+        self._values = array("d")
+        for (i, j), value in sorted(merged.items()):
+            if value:
+                self._indptr[i + 1] += 1
+                self._indices.append(j)
+                self._values.append(value)
+        for i in range(rows):
+            self._indptr[i + 1] += self._indptr[i]
+
+    @classmethod
+    def from_coo(cls, rows, columns, entries):
+        """Create a rows x columns matrix from (row, column, value) triples."""
+        matrix = cls.__new__(cls)
+        matrix._build(rows, columns, entries)
+        return matrix
+
+    @classmethod
+    def from_dense(cls, matrix):
+        """Create a sparse matrix holding the elements of a Matrix."""
+        columns = matrix._columns
+        entries = [(k // columns, k % columns, value)
+                   for k, value in enumerate(matrix._data) if value]
+        return cls.from_coo(matrix._rows, columns, entries)
+
+    def to_coo(self):
+        """Return the non-zero elements as (row, column, value) triples."""
+        return [(i, self._indices[k], self._values[k])
+                for i in range(self._rows)
+                for k in range(self._indptr[i], self._indptr[i + 1])]
+
+    def to_dense(self):
+        """Return the matrix as a Matrix."""
+        data = array("d", bytes(self._rows * self._columns
+                                * array("d").itemsize))
+        for i, j, value in self.to_coo():
+            data[i * self._columns + j] = value
+        return Matrix._from_flat(self._rows, self._columns, data)
+
+    @property
+    def nnz(self):
+        """Return the number of stored non-zero elements."""
+        return len(self._values)
+
+    def __str__(self):
+        """Return the string representation of the matrix."""
+        return str(self.to_dense())
+
+    def __repr__(self):
+        """Return the representation of the matrix."""
+        return (f"{self.__class__.__name__}.from_coo({self._rows}, "
+                f"{self._columns}, {self.to_coo()})")
+
+    def _row_items(self, i):
+        """Return the column indices and values of the i-th row."""
+        start, stop = self._indptr[i], self._indptr[i + 1]
+        return self._indices[start:stop], self._values[start:stop]
+
+    def _locate(self, indexes):
+        """Return the row, column and store position of indexes.
+
+        The position is where the element is, or where it would be inserted.
+        """
+        i, j = indexes
+        if i < 0:
+            i += self._rows
+        if j < 0:
+            j += self._columns
+        if not (0 <= i < self._rows and 0 <= j < self._columns):
+            raise IndexError(f"{self.__class__.__name__} index out of range")
+        position = bisect_left(self._indices, j, self._indptr[i],
+                               self._indptr[i + 1])
+        return i, j, position
+
+    def _is_stored(self, i, j, position):
+        """Check whether position holds the element at (i, j)."""
+        return position < self._indptr[i + 1] and self._indices[position] == j
+
+    def __getitem__(self, indexes):
+        """Return the element of the matrix with specified indexes."""
+        i, j, position = self._locate(indexes)
+        if self._is_stored(i, j, position):
+            return self._values[position]
+        return 0.0
+
+    def __setitem__(self, indexes, value):
+        """Set the value of the element at indexes indexes."""
+        i, j, position = self._locate(indexes)
+        if self._is_stored(i, j, position):
+            if value:
+                self._values[position] = value
+                return
+            del self._indices[position]
+            del self._values[position]
+            shift = -1
+        elif value:
+            self._indices.insert(position, j)
+            self._values.insert(position, value)
+            shift = 1
+        else:
+            return
+        for row in range(i + 1, self._rows + 1):
+            self._indptr[row] += shift
+
+    def __add__(self, other):
+        """Return the result of the two matrix addition.
+
+        The sum of two sparse matrices is sparse, adding a Matrix gives
+        a Matrix.
+        """
+        if not isinstance(other, (SparseMatrix, Matrix)):
+            return NotImplemented
+        if self._rows != other._rows or self._columns != other._columns:
+            raise ValueError("Can't add matricies with different dimensions.")
+        if isinstance(other, Matrix):
+            data = array("d", other._data)
+            for i, j, value in self.to_coo():
+                data[i * self._columns + j] += value
+            return Matrix._from_flat(self._rows, self._columns, data)
+        result = self.__class__.__new__(self.__class__)
+        result._build(self._rows, self._columns,
+                      self.to_coo() + other.to_coo())
+        return result
+
+    __radd__ = __add__
+
+    def __mul__(self, other):
+        """Return the result of matrix multiplication.
+
+        The product of two sparse matrices is sparse, multiplying by
+        a Matrix gives a Matrix. Either way the work is proportional to the
+        number of non-zero products rather than to the matrix sizes.
+        """
+        if not isinstance(other, (SparseMatrix, Matrix)):
+            return NotImplemented
+        if self._columns != other._rows:
+            raise ValueError("Inappropriate sizes of matricies.")
+        if isinstance(other, Matrix):
+            return self._mul_dense(other)
+        entries = []
+        for i in range(self._rows):
+            row = {}
+            for k, a_ik in zip(*self._row_items(i)):
+                for j, b_kj in zip(*other._row_items(k)):
+                    row[j] = row.get(j, 0.0) + a_ik * b_kj
+            entries.extend((i, j, value) for j, value in row.items())
+        return self.from_coo(self._rows, other._columns, entries)
+
+    def _mul_dense(self, other):
+        """Return the product of the matrix and a Matrix."""
+        p = other._columns
+        data = array("d")
+        for i in range(self._rows):
+            row = [0.0] * p
+            for k, a_ik in zip(*self._row_items(i)):
+                row = [x + a_ik * y
+                       for x, y in zip(row, other._data[k * p:(k + 1) * p])]
+            data.extend(row)
+        return Matrix._from_flat(self._rows, p, data)
+
+    def __rmul__(self, other):
+        """Return the product of a Matrix and the matrix."""
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        if other._columns != self._rows:
+            raise ValueError("Inappropriate sizes of matricies.")
+        m, p = other._columns, self._columns
+        data = array("d")
+        for i in range(other._rows):
+            row = [0.0] * p
+            for k, a_ik in enumerate(other._data[i * m:(i + 1) * m]):
+                if a_ik:
+                    for j, b_kj in zip(*self._row_items(k)):
+                        row[j] += a_ik * b_kj
+            data.extend(row)
+        return Matrix._from_flat(other._rows, p, data)
+
+
+if __name__ == "__main__":
+    sparse = SparseMatrix([[1, 0, 0], [0, 0, 2]])
+    dense = Matrix([[1, 2], [3, 4], [5, 6]])
+    print(sparse * dense)
+    print(dense * sparse)
+    print(repr(sparse + sparse))